@@ -1,3 +1,6 @@
+import numpy as np
+
+from core import kernels
 from core.exchange import NutrientExchange
 from core.garden import Garden
 
@@ -7,36 +10,82 @@ class Engine:
         self.garden = garden
         self.nutrient_exchange = NutrientExchange(garden=garden)
         self.turn = 0
-        self.growth_history: list[float] = []
+        # NOTE: Totals are written into a preallocated buffer, growth_history copies the filled
+        # part out so callers never hold a view the buffer can grow away from. The copy is
+        # cached until the next turn, readers polling it every frame share one list
+        self._history = np.zeros(0, dtype=np.float64)
+        self._history_list: list[float] | None = None
+
+    @property
+    def growth_history(self) -> list[float]:
+        if self._history_list is None:
+            self._history_list = self._history[: self.turn].tolist()
+
+        return self._history_list
+
+    def _reserve_history(self, turns: int) -> None:
+        needed = self.turn + turns
+        if needed > len(self._history):
+            history = np.zeros(max(needed, 2 * len(self._history)), dtype=np.float64)
+            history[: self.turn] = self._history[: self.turn]
+            self._history = history
+
+    def _record_total(self, total_growth: float) -> None:
+        self._reserve_history(1)
+        self._history[self.turn] = total_growth
+        self.turn += 1
+        self._history_list = None
 
     def _daytime_production(self) -> None:
-        for plant in self.garden.plants:
-            plant.produce()
+        self.garden.produce_all()
 
     def _evening_exchange(self) -> None:
         self.nutrient_exchange.execute()
 
     def _overnight_growth(self) -> float:
-        turn_growth = 0.0
+        return self.garden.grow_all()
 
-        for plant in self.garden.plants:
-            turn_growth += plant.grow()
+    def _compiled_turn(self) -> float:
+        table = self.garden.table
+        pair_i, pair_j = self.garden.interaction_index()
 
-        return turn_growth
+        return kernels.run_turn(
+            table.inventory,
+            table.coeffs,
+            table.reservoir,
+            table.radius,
+            table.size,
+            table.max_size,
+            table.produced_idx,
+            self.garden.partner_counts(),
+            pair_i,
+            pair_j,
+        )
+
+    def _run_phases(self) -> float:
+        # NOTE: With numba installed the fused kernel runs the turn, the NumPy phases are the
+        # fallback and the reference the kernel is tested against
+        if kernels.HAS_NUMBA:
+            return self._compiled_turn()
 
-    def run_turn(self):
         self._daytime_production()
         self._evening_exchange()
-        growth = self._overnight_growth()
+        return self._overnight_growth()
 
-        total_growth = self.garden.total_growth()
-        self.growth_history.append(total_growth)
-        self.turn += 1
+    def run_turn(self):
+        growth = self._run_phases()
+        self._record_total(self.garden.total_growth())
 
         return growth
 
     def run_simulation(self, turns: int) -> list[float]:
+        self._reserve_history(turns)
+
+        # NOTE: Sizes only change through growth, so keep a running total instead of
+        # summing every plant each turn
+        total_growth = self.garden.total_growth()
         for _ in range(turns):
-            self.run_turn()
+            total_growth += self._run_phases()
+            self._record_total(total_growth)
 
         return self.growth_history
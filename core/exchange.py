@@ -1,11 +1,28 @@
+import numpy as np
+
+from core import kernels
 from core.garden import Garden
 from core.plants.plant import Plant
+from core.plants.plant_table import PlantTable
+
+
+def _round_offers(amounts: np.ndarray) -> np.ndarray:
+    rounded = np.round(amounts, 2)
+
+    # NOTE: np.round scales by 100 first, which can flip values sitting on a .5 tie
+    # compared to round(); fall back to round() for those few entries
+    scaled = amounts * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        rounded[i] = round(float(amounts[i]), 2)
+
+    return rounded
 
 
 class NutrientExchange:
     def __init__(self, garden: Garden) -> None:
         self.garden = garden
-        self.offers = {}
+        self.offers = np.zeros(0)
 
     def _calculate_offer_to_partner(self, plant: Plant) -> float:
         total_offer = plant.offer_amount()
@@ -14,46 +31,79 @@ class NutrientExchange:
         num_partners = len(partners)
         return total_offer / num_partners if num_partners > 0 else 0.0
 
-    def _should_exchange(self, plant1: Plant, plant2: Plant) -> bool:
-        nutrient1 = plant1._get_produced_nutrient()
-        nutrient2 = plant2._get_produced_nutrient()
-
-        plant1_has_surplus = (
-            plant1.micronutrient_inventory[nutrient1] > plant1.micronutrient_inventory[nutrient2]
-        )
-
-        plant2_has_surplus = (
-            plant2.micronutrient_inventory[nutrient2] > plant2.micronutrient_inventory[nutrient1]
+    def _calculate_offers(self) -> np.ndarray:
+        table = self.garden.table
+        num_partners = self.garden.partner_counts()
+
+        produced = table.inventory[np.arange(len(table)), table.produced_idx]
+        total_offers = _round_offers(produced / 4)
+
+        # NOTE: Reuse the offers buffer across turns, only reallocating when plants change
+        if len(self.offers) != len(table):
+            self.offers = np.zeros(len(table))
+        else:
+            self.offers.fill(0.0)
+
+        np.divide(total_offers, num_partners, out=self.offers, where=num_partners > 0)
+        return self.offers
+
+    def _should_exchange(
+        self,
+        inventory: np.ndarray,
+        pair_i: np.ndarray,
+        pair_j: np.ndarray,
+        produced_idx: np.ndarray,
+    ) -> np.ndarray:
+        nutrient1 = produced_idx[pair_i]
+        nutrient2 = produced_idx[pair_j]
+
+        plant1_has_surplus = inventory[pair_i, nutrient1] > inventory[pair_i, nutrient2]
+        plant2_has_surplus = inventory[pair_j, nutrient2] > inventory[pair_j, nutrient1]
+
+        return plant1_has_surplus & plant2_has_surplus
+
+    def _exchange_nutrients(
+        self, table: PlantTable, pair_i: np.ndarray, pair_j: np.ndarray
+    ) -> None:
+        exchange_amount = np.minimum(self.offers[pair_i], self.offers[pair_j])
+
+        exchanging = exchange_amount > 0
+        pair_i = pair_i[exchanging]
+        pair_j = pair_j[exchanging]
+        exchange_amount = exchange_amount[exchanging]
+
+        nutrient1 = table.produced_idx[pair_i]
+        nutrient2 = table.produced_idx[pair_j]
+
+        # NOTE: Interleave both sides of each pair so the ufunc.at calls apply amounts
+        # in the same order as exchanging pair by pair. A plant only gives its own
+        # nutrient and only receives others, so gives and receives never touch the
+        # same cell and capping once after all receives equals capping every receive.
+        plants = np.column_stack((pair_i, pair_j)).ravel()
+        given = np.column_stack((nutrient1, nutrient2)).ravel()
+        received = np.column_stack((nutrient2, nutrient1)).ravel()
+        amounts = np.repeat(exchange_amount, 2)
+
+        inventory = table.inventory
+        np.subtract.at(inventory, (plants, given), amounts)
+        np.add.at(inventory, (plants, received), amounts)
+
+        inventory[plants, received] = np.minimum(
+            inventory[plants, received], table.reservoir[plants]
         )
 
-        return plant1_has_surplus and plant2_has_surplus
-
-    def _exchange_nutrients(self, plant1: Plant, plant2: Plant) -> None:
-        offer1 = self.offers[id(plant1)]
-        offer2 = self.offers[id(plant2)]
-
-        exchange_amount = min(offer1, offer2)
-
-        if exchange_amount > 0:
-            nutrient1 = plant1._get_produced_nutrient()
-            nutrient2 = plant2._get_produced_nutrient()
-
-            plant1.give_nutrient(exchange_amount)
-            plant1.receive_nutrient(nutrient2, exchange_amount)
-
-            plant2.give_nutrient(exchange_amount)
-            plant2.receive_nutrient(nutrient1, exchange_amount)
-
     def execute(self) -> None:
-        interactions = self.garden.get_all_interactions()
-        eligible_exchanges = []
+        table = self.garden.table
+        pair_i, pair_j = self.garden.interaction_index()
 
-        for plant in self.garden.plants:
-            self.offers[id(plant)] = self._calculate_offer_to_partner(plant)
+        self._calculate_offers()
 
-        for plant1, plant2 in interactions:
-            if self._should_exchange(plant1, plant2):
-                eligible_exchanges.append((plant1, plant2))
+        # NOTE: Same dispatch as Engine, compiled when numba is installed
+        if kernels.HAS_NUMBA:
+            kernels.exchange_nutrients(
+                table.inventory, table.reservoir, table.produced_idx, self.offers, pair_i, pair_j
+            )
+            return
 
-        for plant1, plant2 in eligible_exchanges:
-            self._exchange_nutrients(plant1, plant2)
+        eligible = self._should_exchange(table.inventory, pair_i, pair_j, table.produced_idx)
+        self._exchange_nutrients(table, pair_i[eligible], pair_j[eligible])
@@ -1,15 +1,141 @@
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+
+import numpy as np
+
 from core.plants.plant import Plant
+from core.plants.plant_table import PlantTable
 from core.plants.plant_variety import PlantVariety
 from core.point import Position
 
+PLACEMENT_CELL_SIZE = 3.0
+# NOTE: Relative band around a threshold where squared and actual distances can disagree
+DISTANCE_TOLERANCE = 1e-9
+
+
+def within_distance(dx: np.ndarray, dy: np.ndarray, threshold: np.ndarray) -> np.ndarray:
+    """Mask of offsets closer than threshold, deciding exactly as Garden._calculate_distance."""
+    dx, dy, threshold = np.broadcast_arrays(dx, dy, threshold)
+    distance_sq = dx * dx + dy * dy
+    threshold_sq = threshold * threshold
+    within = distance_sq < threshold_sq
+
+    # NOTE: Plants packed on a hex grid sit right at the threshold, where the squared test can
+    # round the other way, so those offsets are decided on the actual distance
+    boundary = np.abs(distance_sq - threshold_sq) <= DISTANCE_TOLERANCE * threshold_sq
+    for idx in zip(*np.nonzero(boundary), strict=True):
+        x, y = float(dx[idx]), float(dy[idx])
+        within[idx] = (x**2 + y**2) ** 0.5 < threshold[idx]
+
+    return within
+
+
+def _counts_mutation(method_name: str):
+    method = getattr(list, method_name)
+
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = method_name
+    return mutate
+
+
+class PlantList(list):
+    """A garden's plant list, counting mutations so the garden notices direct edits."""
+
+    def __init__(self, plants: Iterable[Plant] = (), version: int = 0) -> None:
+        super().__init__(plants)
+        self.version = version
+
+    def __reduce_ex__(self, protocol):
+        return (PlantList, (list(self), self.version))
+
+    append = _counts_mutation('append')
+    extend = _counts_mutation('extend')
+    insert = _counts_mutation('insert')
+    remove = _counts_mutation('remove')
+    pop = _counts_mutation('pop')
+    clear = _counts_mutation('clear')
+    sort = _counts_mutation('sort')
+    reverse = _counts_mutation('reverse')
+    __setitem__ = _counts_mutation('__setitem__')
+    __delitem__ = _counts_mutation('__delitem__')
+    __iadd__ = _counts_mutation('__iadd__')
+    __imul__ = _counts_mutation('__imul__')
+
 
 class Garden:
     def __init__(self, width: float = 16.0, height: float = 10.0) -> None:
         self.width = width
         self.height = height
-        self.plants: list[Plant] = []
+        self._plants = PlantList()
         self._used_varieties: set[int] = set()
 
+        # NOTE: Plant state is stored column-wise in _table, row i <-> plants[i], as of
+        # version _table_version of the plant list
+        self._table = PlantTable()
+        self._table_version = 0
+
+        # NOTE: Positions never move, so interacting pairs are cached until plants change
+        self._pairs: list[tuple[int, int]] | None = None
+        self._pair_index: tuple[np.ndarray, np.ndarray] | None = None
+        self._partner_counts: np.ndarray | None = None
+        self._partners: list[list[int]] | None = None
+
+        # NOTE: Plants bucketed by position so placement checks only scan nearby cells
+        self._placement_cells: dict[tuple[int, int], list[Plant]] = defaultdict(list)
+        self._max_radius = 0
+
+    @property
+    def plants(self) -> PlantList:
+        return self._plants
+
+    @plants.setter
+    def plants(self, plants: Iterable[Plant]) -> None:
+        # NOTE: A replaced list continues the old count so the table is rebuilt
+        self._plants = PlantList(plants, version=self._plants.version + 1)
+
+    @property
+    def table(self) -> PlantTable:
+        return self._sync_table()
+
+    def _clear_interactions(self) -> None:
+        self._pairs = None
+        self._pair_index = None
+        self._partner_counts = None
+        self._partners = None
+
+    def _sync_table(self) -> PlantTable:
+        # NOTE: Gardeners may edit self.plants directly, rebuild the table if so
+        if self._plants.version != self._table_version:
+            table = PlantTable()
+            for plant in self.plants:
+                plant._rebind(table)
+
+            self._table = table
+            self._table_version = self._plants.version
+            self._clear_interactions()
+
+            self._placement_cells = defaultdict(list)
+            self._max_radius = 0
+            for plant in self.plants:
+                self._index_plant(plant)
+
+        return self._table
+
+    def _placement_cell(self, position: Position) -> tuple[int, int]:
+        return (
+            int(position.x // PLACEMENT_CELL_SIZE),
+            int(position.y // PLACEMENT_CELL_SIZE),
+        )
+
+    def _index_plant(self, plant: Plant) -> None:
+        self._table.position[plant._idx] = (plant.position.x, plant.position.y)
+        self._placement_cells[self._placement_cell(plant.position)].append(plant)
+        self._max_radius = max(self._max_radius, plant.variety.radius)
+
     def _calculate_distance(self, pos1: Position, pos2: Position) -> float:
         dx = pos1.x - pos2.x
         dy = pos1.y - pos2.y
@@ -25,12 +151,22 @@ class Garden:
         if id(variety) in self._used_varieties:
             return False
 
-        for existing_plant in self.plants:
-            distance = self._calculate_distance(position, existing_plant.position)
-            min_distance = max(variety.radius, existing_plant.variety.radius)
+        self._sync_table()
+
+        radius = variety.radius
+        span = math.ceil(max(radius, self._max_radius) / PLACEMENT_CELL_SIZE)
+        cx, cy = self._placement_cell(position)
 
-            if distance < min_distance:
-                return False
+        for gx in range(cx - span, cx + span + 1):
+            for gy in range(cy - span, cy + span + 1):
+                for existing_plant in self._placement_cells.get((gx, gy), ()):
+                    # NOTE: Compare actual distances, plants packed on a hex grid sit at a
+                    # squared distance one ulp under the squared minimum
+                    min_distance = max(radius, existing_plant.variety.radius)
+                    distance = self._calculate_distance(position, existing_plant.position)
+
+                    if distance < min_distance:
+                        return False
 
         return True
 
@@ -38,42 +174,125 @@ class Garden:
         if not self.can_place_plant(variety, position):
             return None
 
-        plant = Plant(variety=variety, position=position)
-        self.plants.append(plant)
+        table = self._sync_table()
+        plant = Plant(variety=variety, position=position, table=table)
+        self._plants.append(plant)
+        self._table_version = self._plants.version
+        self._clear_interactions()
+        self._index_plant(plant)
         self._used_varieties.add(id(variety))
         return plant
 
     def get_interacting_plants(self, plant: Plant) -> list[Plant]:
-        interacting = []
-        for other_plant in self.plants:
-            if other_plant is plant:
-                continue
+        self._sync_table()
+        if plant._table is self._table:
+            return [self.plants[j] for j in self._plant_partners()[plant._idx]]
+
+        # NOTE: Plants outside the garden aren't in the pair cache, test them against all rows
+        table = self._table
+        dx = table.position[:, 0] - plant.position.x
+        dy = table.position[:, 1] - plant.position.y
+        interaction_distance = table.radius + plant.variety.radius
+
+        interacting = within_distance(dx, dy, interaction_distance) & (
+            table.species_idx != plant.variety.species.value - 1
+        )
+        return [self.plants[j] for j in np.flatnonzero(interacting)]
+
+    def _interaction_pairs(self) -> list[tuple[int, int]]:
+        self._sync_table()
+        if self._pairs is not None:
+            return self._pairs
+
+        # NOTE: Bucket plants into cells as wide as the largest interaction distance,
+        # so every partner of a plant lies in its own or one of the 8 adjacent cells
+        cell_size = 2 * max((plant.variety.radius for plant in self.plants), default=1)
+        cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+        plant_cells = []
+        for i, plant in enumerate(self.plants):
+            cell = (
+                int(plant.position.x // cell_size),
+                int(plant.position.y // cell_size),
+            )
+            cells[cell].append(i)
+            plant_cells.append(cell)
+
+        pairs = []
+        for i, plant in enumerate(self.plants):
+            cx, cy = plant_cells[i]
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for j in cells.get((cx + dx, cy + dy), ()):
+                        if j <= i:
+                            continue
 
-            if plant.variety.species == other_plant.variety.species:
-                continue
+                        other_plant = self.plants[j]
+                        if plant.variety.species == other_plant.variety.species:
+                            continue
 
-            distance = self._calculate_distance(plant.position, other_plant.position)
-            interaction_distance = plant.variety.radius + other_plant.variety.radius
+                        distance = self._calculate_distance(plant.position, other_plant.position)
+                        interaction_distance = plant.variety.radius + other_plant.variety.radius
 
-            if distance < interaction_distance:
-                interacting.append(other_plant)
+                        if distance < interaction_distance:
+                            pairs.append((i, j))
 
-        return interacting
+        # NOTE: Keep the (i, j), i < j plant order so exchanges apply in a stable order
+        pairs.sort()
+        self._pairs = pairs
+        return pairs
+
+    def interaction_index(self) -> tuple[np.ndarray, np.ndarray]:
+        pairs = self._interaction_pairs()
+        if self._pair_index is None:
+            pair_array = np.array(pairs, dtype=np.intp).reshape(-1, 2)
+            self._pair_index = (pair_array[:, 0].copy(), pair_array[:, 1].copy())
+
+        return self._pair_index
+
+    def partner_counts(self) -> np.ndarray:
+        pair_i, pair_j = self.interaction_index()
+        if self._partner_counts is None:
+            endpoints = np.concatenate((pair_i, pair_j))
+            self._partner_counts = np.bincount(endpoints, minlength=len(self.plants))
+
+        return self._partner_counts
+
+    def _plant_partners(self) -> list[list[int]]:
+        pairs = self._interaction_pairs()
+        if self._partners is None:
+            # NOTE: Pairs are sorted, so each partner list comes out in plant order
+            partners: list[list[int]] = [[] for _ in self.plants]
+            for i, j in pairs:
+                partners[i].append(j)
+                partners[j].append(i)
+            self._partners = partners
+
+        return self._partners
 
     def get_all_interactions(self) -> list[tuple[Plant, Plant]]:
-        interactions = []
-        processed = set()
+        return [(self.plants[i], self.plants[j]) for i, j in self._interaction_pairs()]
+
+    def produce_all(self) -> None:
+        table = self._sync_table()
+
+        new_inventory = table.inventory + table.coeffs
+        can_produce = (new_inventory >= 0).all(axis=1)
+        np.minimum(new_inventory, table.reservoir[:, None], out=new_inventory)
+
+        table.inventory[can_produce] = new_inventory[can_produce]
+
+    def grow_all(self) -> float:
+        table = self._sync_table()
+
+        can_grow = (table.inventory >= 2 * table.radius[:, None]).all(axis=1) & (
+            table.size < table.max_size
+        )
+        radius = table.radius[can_grow]
 
-        for plant in self.plants:
-            interacting = self.get_interacting_plants(plant)
-            for partner in interacting:
-                # NOTE: Use frozenset to avoid duplicates (A,B) and (B,A)
-                pair = frozenset([id(plant), id(partner)])
-                if pair not in processed:
-                    processed.add(pair)
-                    interactions.append((plant, partner))
+        table.inventory[can_grow] -= radius[:, None]
+        table.size[can_grow] += radius
 
-        return interactions
+        return float(radius.sum())
 
     def total_growth(self) -> float:
-        return sum(plant.size for plant in self.plants)
+        return float(self._sync_table().size.sum())
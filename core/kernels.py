@@ -0,0 +1,152 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# NOTE: Veltkamp splitting constant 2**27 + 1, splits a double into two 26-bit halves
+SPLIT = 134217729.0
+# NOTE: From 2**52 on every double is an integer and rounding to cents changes nothing
+EXACT_INTEGER_LIMIT = 4503599627370496.0
+
+
+@njit(cache=True)
+def exchange_nutrients(
+    inventory: np.ndarray,
+    reservoir: np.ndarray,
+    produced_idx: np.ndarray,
+    offers: np.ndarray,
+    pair_i: np.ndarray,
+    pair_j: np.ndarray,
+) -> None:
+    """Exchange nutrients between interacting pairs in order, updating inventory in place."""
+    num_pairs = pair_i.shape[0]
+
+    # NOTE: Eligibility is decided on the inventory before any exchange
+    eligible = np.zeros(num_pairs, dtype=np.bool_)
+    for k in range(num_pairs):
+        i, j = pair_i[k], pair_j[k]
+        n1, n2 = produced_idx[i], produced_idx[j]
+        eligible[k] = inventory[i, n1] > inventory[i, n2] and inventory[j, n2] > inventory[j, n1]
+
+    for k in range(num_pairs):
+        if not eligible[k]:
+            continue
+
+        i, j = pair_i[k], pair_j[k]
+        amount = min(offers[i], offers[j])
+        if amount > 0:
+            n1, n2 = produced_idx[i], produced_idx[j]
+
+            inventory[i, n1] -= amount
+            inventory[i, n2] = min(reservoir[i], inventory[i, n2] + amount)
+
+            inventory[j, n2] -= amount
+            inventory[j, n1] = min(reservoir[j], inventory[j, n1] + amount)
+
+
+@njit(cache=True)
+def produce(inventory: np.ndarray, coeffs: np.ndarray, reservoir: np.ndarray) -> None:
+    """Daytime production in place, a plant only produces if no nutrient would go negative."""
+    for p in range(inventory.shape[0]):
+        can_produce = True
+        for n in range(3):
+            if inventory[p, n] + coeffs[p, n] < 0:
+                can_produce = False
+        if can_produce:
+            for n in range(3):
+                inventory[p, n] = min(reservoir[p], inventory[p, n] + coeffs[p, n])
+
+
+@njit(cache=True)
+def grow(
+    inventory: np.ndarray, radius: np.ndarray, size: np.ndarray, max_size: np.ndarray
+) -> float:
+    """Overnight growth in place, returning the total growth."""
+    turn_growth = 0.0
+    for p in range(inventory.shape[0]):
+        can_grow = size[p] < max_size[p]
+        for n in range(3):
+            if inventory[p, n] < 2 * radius[p]:
+                can_grow = False
+        if can_grow:
+            for n in range(3):
+                inventory[p, n] -= radius[p]
+            size[p] += radius[p]
+            turn_growth += radius[p]
+
+    return turn_growth
+
+
+@njit(cache=True)
+def round_cents(x: float) -> float:
+    """round(x, 2) as Python computes it, rounding half to even on the exact value of x."""
+    a = abs(x)
+    scaled = a * 100.0
+    if not scaled < EXACT_INTEGER_LIMIT:
+        return x
+
+    # NOTE: Dekker's product, scaled + error is exactly a * 100, which decides .5 ties
+    # that numba's round() and np.round settle on the rounded product
+    split = SPLIT * a
+    high = split - (split - a)
+    low = a - high
+    error = (high * 100.0 - scaled) + low * 100.0
+
+    floor = math.floor(scaled)
+    above_half = scaled - floor - 0.5
+    if above_half == 0:
+        above_half = error
+
+    if above_half > 0 or (above_half == 0 and floor % 2 == 1):
+        floor += 1.0
+
+    cents = floor / 100.0
+    return -cents if x < 0 else cents
+
+
+@njit(cache=True)
+def calculate_offers(
+    inventory: np.ndarray, produced_idx: np.ndarray, partner_counts: np.ndarray
+) -> np.ndarray:
+    """Offer per partner, a quarter of the produced nutrient split evenly across partners."""
+    offers = np.zeros(inventory.shape[0])
+    for p in range(inventory.shape[0]):
+        if partner_counts[p] > 0:
+            offers[p] = round_cents(inventory[p, produced_idx[p]] / 4) / partner_counts[p]
+
+    return offers
+
+
+@njit(cache=True)
+def run_turn(
+    inventory: np.ndarray,
+    coeffs: np.ndarray,
+    reservoir: np.ndarray,
+    radius: np.ndarray,
+    size: np.ndarray,
+    max_size: np.ndarray,
+    produced_idx: np.ndarray,
+    partner_counts: np.ndarray,
+    pair_i: np.ndarray,
+    pair_j: np.ndarray,
+) -> float:
+    """Run production, exchange and growth for one turn in place, returning the growth."""
+    produce(inventory, coeffs, reservoir)
+
+    offers = calculate_offers(inventory, produced_idx, partner_counts)
+    exchange_nutrients(inventory, reservoir, produced_idx, offers, pair_i, pair_j)
+
+    return grow(inventory, radius, size, max_size)
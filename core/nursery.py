@@ -1,6 +1,8 @@
 import json
 import random
 
+import numpy as np
+
 from core.micronutrients import Micronutrient
 from core.plants.plant_variety import PlantVariety
 from core.plants.species import Species
@@ -89,20 +91,24 @@ class Nursery:
             )
 
     def generate_random_varieties(self, count: int) -> list[PlantVariety]:
-        varieties = []
+        # NOTE: Seed NumPy from the random module so random.seed() keeps runs reproducible
+        rng = np.random.default_rng(random.getrandbits(64))
+
         species_list = [Species.RHODODENDRON, Species.GERANIUM, Species.BEGONIA]
+        species_ids = rng.integers(0, len(species_list), count)
+        radii = rng.choice([1, 2, 3], count)
+        coefficients = self._sample_coefficients(rng, radii)
 
+        varieties = []
         for i in range(count):
-            species = random.choice(species_list)
-            radius = random.choice([1, 2, 3])
-
-            coefficients = self._generate_valid_coefficients(species, radius)
+            species = species_list[species_ids[i]]
+            radius = int(radii[i])
 
             variety = PlantVariety(
                 name=f'{species.value}_{i + 1}',
                 radius=radius,
                 species=species,
-                nutrient_coefficients=coefficients,
+                nutrient_coefficients=self._assign_coefficients(species, coefficients[i]),
             )
 
             self._validate_variety(variety)
@@ -111,11 +117,27 @@ class Nursery:
         self.varieties = varieties
         return varieties
 
-    def _generate_valid_coefficients(
-        self, species: Species, radius: int
-    ) -> dict[Micronutrient, float]:
-        max_val = 2 * radius
+    def _sample_coefficients(self, rng: np.random.Generator, radii: np.ndarray) -> np.ndarray:
+        count = len(radii)
+        max_val = 2 * radii
+
+        produced_val = rng.uniform(0.3, max_val, count)
+
+        max_consumed_total = produced_val - 0.1
 
+        consumed1_abs = rng.uniform(0.1, max_consumed_total - 0.1, count)
+        consumed2_abs = rng.uniform(0.1, max_consumed_total - consumed1_abs, count)
+
+        # NOTE: Randomly swap which consumed nutrient gets which amount
+        swap = rng.random(count) < 0.5
+        consumed1_val = np.where(swap, -consumed2_abs, -consumed1_abs)
+        consumed2_val = np.where(swap, -consumed1_abs, -consumed2_abs)
+
+        return np.column_stack((produced_val, consumed1_val, consumed2_val))
+
+    def _assign_coefficients(
+        self, species: Species, values: np.ndarray
+    ) -> dict[Micronutrient, float]:
         if species == Species.RHODODENDRON:
             produced, consumed1, consumed2 = (
                 Micronutrient.R,
@@ -135,23 +157,12 @@ class Nursery:
                 Micronutrient.G,
             )
 
-        produced_val = random.uniform(0.3, max_val)
-
-        max_consumed_total = produced_val - 0.1
-
-        consumed1_abs = random.uniform(0.1, max_consumed_total - 0.1)
-        consumed2_abs = random.uniform(0.1, max_consumed_total - consumed1_abs)
-
-        consumed1_val = -consumed1_abs
-        consumed2_val = -consumed2_abs
-
-        coefficients = [consumed1_val, consumed2_val]
-        random.shuffle(coefficients)
+        produced_val, consumed1_val, consumed2_val = values.tolist()
 
         return {
             produced: round(produced_val, 2),
-            consumed1: round(coefficients.pop(), 2),
-            consumed2: round(coefficients.pop(), 2),
+            consumed1: round(consumed1_val, 2),
+            consumed2: round(consumed2_val, 2),
         }
 
     def get_varieties(self) -> list[PlantVariety]:
@@ -1,87 +1,123 @@
-from typing import assert_never
+from collections.abc import Mapping
+
+import numpy as np
 
 from core.micronutrients import Micronutrient
+from core.plants.plant_table import (
+    NUTRIENT_COLUMNS,
+    PRODUCED_NUTRIENT,
+    NutrientInventory,
+    PlantTable,
+)
 from core.plants.plant_variety import PlantVariety
-from core.plants.species import Species
 from core.point import Position
 
 
 class Plant:
-    def __init__(self, variety: PlantVariety, position: Position) -> None:
+    __slots__ = (
+        'variety',
+        'position',
+        'reservoir_capacity',
+        'max_size',
+        '_radius',
+        '_grow_threshold',
+        '_produced_nutrient',
+        '_produced_idx',
+        '_table',
+        '_idx',
+    )
+
+    def __init__(
+        self, variety: PlantVariety, position: Position, table: PlantTable | None = None
+    ) -> None:
         self.variety = variety
         self.position = position
 
-        self.reservoir_capacity = 10 * self.variety.radius
-        self.max_size = 100 * (self.variety.radius**2)
+        self._radius = variety.radius
+        self.reservoir_capacity = 10 * self._radius
+        self.max_size = 100 * (self._radius**2)
+        self._grow_threshold = 2 * self._radius
+
+        self._produced_nutrient = PRODUCED_NUTRIENT[variety.species]
+        self._produced_idx = NUTRIENT_COLUMNS[self._produced_nutrient]
+
+        # NOTE: State lives in a row of a PlantTable; standalone plants get their own
+        self._table = table if table is not None else PlantTable()
+        self._idx = self._table.append(variety)
+
+    def _rebind(self, table: PlantTable) -> None:
+        idx = table.append(self.variety)
+        table.copy_state(idx, self._table, self._idx)
+        self._table = table
+        self._idx = idx
+
+    @property
+    def size(self) -> float:
+        return float(self._table.size[self._idx])
+
+    @size.setter
+    def size(self, value: float) -> None:
+        self._table.size[self._idx] = value
 
-        self.size = 0.0
-        self.micronutrient_inventory: dict[Micronutrient, float] = {
-            nutrient: self.reservoir_capacity / 2 for nutrient in Micronutrient
-        }
+    @property
+    def micronutrient_inventory(self) -> NutrientInventory:
+        return NutrientInventory(self._table, self._idx)
+
+    @micronutrient_inventory.setter
+    def micronutrient_inventory(self, values: Mapping[Micronutrient, float]) -> None:
+        self.micronutrient_inventory.assign(values)
+
+    def _inventory_row(self) -> np.ndarray:
+        # NOTE: Fetch the row each call, table storage moves when it grows
+        return self._table.inventory[self._idx]
 
     def produce(self):
-        if not self._can_produce():
-            return
+        inventory = self._inventory_row()
+        new_inventory = inventory + self._table.coeffs[self._idx]
 
-        for nutrient, coeff in self.variety.nutrient_coefficients.items():
-            new_inventory = self.micronutrient_inventory[nutrient] + coeff
-            self.micronutrient_inventory[nutrient] = min(self.reservoir_capacity, new_inventory)
+        if not self._can_produce(new_inventory):
+            return
 
-            # NOTE: Make sure nutrients store don't go negative
-            assert self.micronutrient_inventory[nutrient] >= 0
+        # NOTE: new_inventory was checked non-negative above, so stores can't go negative
+        np.minimum(new_inventory, self.reservoir_capacity, out=inventory)
 
-    def _can_produce(self):
+    def _can_produce(self, new_inventory: np.ndarray | None = None):
         # NOTE: Should production stop if nutrient is full?
-        return all(
-            self.micronutrient_inventory[nutrient] + coeff >= 0
-            for nutrient, coeff in self.variety.nutrient_coefficients.items()
-        )
+        if new_inventory is None:
+            new_inventory = self._inventory_row() + self._table.coeffs[self._idx]
+        return bool((new_inventory >= 0).all())
 
     def grow(self) -> float:
         if not self._can_grow():
             return 0.0
 
-        for nutrient in self.micronutrient_inventory:
-            self.micronutrient_inventory[nutrient] -= self.variety.radius
-
-        self.size += self.variety.radius
+        self._inventory_row()[:] -= self._radius
+        self.size += self._radius
 
-        return self.variety.radius
+        return self._radius
 
     def _can_grow(self):
-        return (
-            all(
-                self.micronutrient_inventory[nutrient] >= 2 * self.variety.radius
-                for nutrient in self.micronutrient_inventory
-            )
-            and self.size < self.max_size
+        return self.size < self.max_size and bool(
+            (self._inventory_row() >= self._grow_threshold).all()
         )
 
     def offer_amount(self) -> float:
-        nutrient = self._get_produced_nutrient()
-        amount = self.micronutrient_inventory[nutrient] / 4
+        amount = float(self._table.inventory[self._idx, self._produced_idx]) / 4
         return round(amount, 2)
 
     def receive_nutrient(self, nutrient: Micronutrient, amount: float) -> None:
-        new_amount = self.micronutrient_inventory[nutrient] + amount
-        self.micronutrient_inventory[nutrient] = min(self.reservoir_capacity, new_amount)
+        inventory = self._inventory_row()
+        col = NUTRIENT_COLUMNS[nutrient]
+        inventory[col] = min(self.reservoir_capacity, float(inventory[col]) + amount)
 
     def give_nutrient(self, amount: float) -> None:
-        nutrient = self._get_produced_nutrient()
-        self.micronutrient_inventory[nutrient] -= amount
+        inventory = self._inventory_row()
+        inventory[self._produced_idx] -= amount
 
-        assert self.micronutrient_inventory[nutrient] >= 0
+        assert inventory[self._produced_idx] >= 0
 
     def _get_produced_nutrient(self) -> Micronutrient:
-        match self.variety.species:
-            case Species.RHODODENDRON:
-                return Micronutrient.R
-            case Species.GERANIUM:
-                return Micronutrient.G
-            case Species.BEGONIA:
-                return Micronutrient.B
-            case _:
-                assert_never(self.variety.species)
+        return self._produced_nutrient
 
     def growth_percentage(self) -> float:
         return (self.size / self.max_size) * 100
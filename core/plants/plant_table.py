@@ -0,0 +1,138 @@
+from collections.abc import Iterator, Mapping, MutableMapping
+
+import numpy as np
+
+from core.micronutrients import Micronutrient
+from core.plants.plant_variety import PlantVariety
+from core.plants.species import Species
+
+# NOTE: Nutrient columns follow Micronutrient order: [R, G, B]
+NUTRIENT_COLUMNS: dict[Micronutrient, int] = {
+    nutrient: col for col, nutrient in enumerate(Micronutrient)
+}
+
+PRODUCED_NUTRIENT: dict[Species, Micronutrient] = {
+    Species.RHODODENDRON: Micronutrient.R,
+    Species.GERANIUM: Micronutrient.G,
+    Species.BEGONIA: Micronutrient.B,
+}
+
+
+class PlantTable:
+    """Structure-of-arrays storage for plant state, one row per plant."""
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._capacity = 0
+
+        self._inventory = np.empty((0, 3), dtype=np.float64)
+        self._coeffs = np.empty((0, 3), dtype=np.float64)
+        self._radius = np.empty(0, dtype=np.float64)
+        self._size = np.empty(0, dtype=np.float64)
+        self._max_size = np.empty(0, dtype=np.float64)
+        self._reservoir = np.empty(0, dtype=np.float64)
+        self._species_idx = np.empty(0, dtype=np.int8)
+        self._produced_idx = np.empty(0, dtype=np.int8)
+        self._position = np.empty((0, 2), dtype=np.float64)
+
+        self._refresh_views()
+
+    def __len__(self) -> int:
+        return self._count
+
+    # NOTE: Copies would turn the column views into arrays of their own, so only the backing
+    # arrays are copied and the views are rebuilt over them
+    def __getstate__(self) -> dict:
+        return {name: value for name, value in self.__dict__.items() if name.startswith('_')}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._refresh_views()
+
+    def _refresh_views(self) -> None:
+        n = self._count
+        self.inventory = self._inventory[:n]
+        self.coeffs = self._coeffs[:n]
+        self.radius = self._radius[:n]
+        self.size = self._size[:n]
+        self.max_size = self._max_size[:n]
+        self.reservoir = self._reservoir[:n]
+        self.species_idx = self._species_idx[:n]
+        self.produced_idx = self._produced_idx[:n]
+        self.position = self._position[:n]
+
+    def _grow_capacity(self) -> None:
+        capacity = max(8, 2 * self._capacity)
+
+        self._inventory = np.resize(self._inventory, (capacity, 3))
+        self._coeffs = np.resize(self._coeffs, (capacity, 3))
+        self._radius = np.resize(self._radius, capacity)
+        self._size = np.resize(self._size, capacity)
+        self._max_size = np.resize(self._max_size, capacity)
+        self._reservoir = np.resize(self._reservoir, capacity)
+        self._species_idx = np.resize(self._species_idx, capacity)
+        self._produced_idx = np.resize(self._produced_idx, capacity)
+        self._position = np.resize(self._position, (capacity, 2))
+
+        self._capacity = capacity
+
+    def append(self, variety: PlantVariety) -> int:
+        if self._count == self._capacity:
+            self._grow_capacity()
+
+        idx = self._count
+        reservoir = 10 * variety.radius
+
+        self._inventory[idx] = reservoir / 2
+        self._coeffs[idx] = [
+            variety.nutrient_coefficients.get(nutrient, 0.0) for nutrient in Micronutrient
+        ]
+        self._radius[idx] = variety.radius
+        self._size[idx] = 0.0
+        self._max_size[idx] = 100 * (variety.radius**2)
+        self._reservoir[idx] = reservoir
+        self._species_idx[idx] = variety.species.value - 1
+        self._produced_idx[idx] = NUTRIENT_COLUMNS[PRODUCED_NUTRIENT[variety.species]]
+        # NOTE: Positions are filled in by the garden that owns the table
+        self._position[idx] = np.nan
+
+        self._count += 1
+        self._refresh_views()
+        return idx
+
+    def copy_state(self, idx: int, source: 'PlantTable', source_idx: int) -> None:
+        self.inventory[idx] = source.inventory[source_idx]
+        self.size[idx] = source.size[source_idx]
+
+
+class NutrientInventory(MutableMapping[Micronutrient, float]):
+    """Dict-like view onto a single plant's inventory row in a PlantTable."""
+
+    def __init__(self, table: PlantTable, idx: int) -> None:
+        self._table = table
+        self._idx = idx
+
+    def __getitem__(self, nutrient: Micronutrient) -> float:
+        return float(self._table.inventory[self._idx, NUTRIENT_COLUMNS[nutrient]])
+
+    def __setitem__(self, nutrient: Micronutrient, amount: float) -> None:
+        self._table.inventory[self._idx, NUTRIENT_COLUMNS[nutrient]] = amount
+
+    def __delitem__(self, nutrient: Micronutrient) -> None:
+        raise TypeError('Nutrients cannot be removed from a plant inventory')
+
+    def __iter__(self) -> Iterator[Micronutrient]:
+        return iter(Micronutrient)
+
+    def __len__(self) -> int:
+        return len(NUTRIENT_COLUMNS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def copy(self) -> dict[Micronutrient, float]:
+        return dict(self)
+
+    def assign(self, values: Mapping[Micronutrient, float]) -> None:
+        for nutrient, amount in values.items():
+            self[nutrient] = amount
@@ -4,7 +4,7 @@ from core.micronutrients import Micronutrient
 from core.plants.species import Species
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlantVariety:
     name: str
     radius: int
@@ -1,10 +1,18 @@
+import math
+
+import numpy as np
 import pygame
 
 from core.engine import Engine
 from core.garden import Garden
 from core.micronutrients import Micronutrient
+from core.plants.plant import Plant
 from core.plants.species import Species
 
+SIMULATION_STEP_MS = 100
+DEBUG_LINES = 7
+DEBUG_LINE_HEIGHT = 18
+
 
 class GardenVisualizer:
     def __init__(
@@ -43,135 +51,243 @@ class GardenVisualizer:
         self.offset_x = self.padding
         self.offset_y = self.padding
 
+        self._scale = np.array([self.scale_x, self.scale_y])
+        self._offset = np.array([self.offset_x, self.offset_y])
+        self._screen_table = None
+        self._screen_pos: list[list[int]] = []
+        self._interaction_key = None
+        self._interaction_overlay: tuple[pygame.Surface, pygame.Rect] | None = None
+
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 28)
         self.tiny_font = pygame.font.Font(None, 20)
 
+        # NOTE: Stats lines only change every few frames, keep the last render per line
+        self._stat_text: dict[int, tuple[str, pygame.Surface]] = {}
+
+        # NOTE: Debug boxes share one translucent background, text is kept per plant
+        self._debug_box = pygame.Surface((150, DEBUG_LINES * DEBUG_LINE_HEIGHT + 10)).convert()
+        self._debug_box.set_alpha(235)
+        self._debug_box.fill((255, 255, 230))
+        self._debug_text: dict[int, tuple[tuple[float, ...], list[pygame.Surface]]] = {}
+
+        # NOTE: Plant drawings keyed by (species index, root radius, plant radius) in pixels
+        self._plant_sprites: dict[tuple[int, int, int], pygame.Surface] = {}
+
+        # NOTE: The grid never changes, so it is drawn once into a background that is
+        # blitted at the start of every frame
+        self._background = self._render_background()
+        # NOTE: Controls and legend are rendered once but drawn after the plants every frame,
+        # so plants reaching into the side panel stay underneath them
+        self._panel_text, self._panel_markers = self._render_static_panel()
+
         self.running = True
         self.paused = True
         self.debug_mode = False  # NEW: Track debug mode state
         self.turn = 0
         self.clock = pygame.time.Clock()
 
+        # NOTE: Screen regions drawn over the background this frame and the previous one,
+        # None until the first full frame has been shown
+        self._dirty: list[pygame.Rect] = []
+        self._prev_dirty: list[pygame.Rect] | None = None
+        self._needs_redraw = True
+        self._sim_accum = 0.0
+
     def garden_to_screen(self, x, y):
         """Convert garden coordinates to screen coordinates."""
         return int(x * self.scale_x + self.offset_x), int(y * self.scale_y + self.offset_y)
 
-    def draw_grid(self):
-        """Draw garden boundaries and grid."""
+    def _screen_positions(self) -> list[list[int]]:
+        """Convert every plant position to screen coordinates at once, in plant order."""
+        table = self.garden.table
+        if table is not self._screen_table or len(table) != len(self._screen_pos):
+            # NOTE: Plants never move, so this only reruns when plants are added or removed
+            screen = (table.position * self._scale + self._offset).astype(np.int64)
+            self._screen_table = table
+            self._screen_pos = screen.tolist()
+
+        return self._screen_pos
+
+    def _render_grid_surface(self) -> pygame.Surface:
+        """Render the garden border and grid once, in coordinates local to the garden."""
         garden_width_px = self.garden.width * self.scale_x
         garden_height_px = self.garden.height * self.scale_y
-        border_rect = pygame.Rect(self.offset_x, self.offset_y, garden_width_px, garden_height_px)
-        pygame.draw.rect(self.screen, (0, 0, 0), border_rect, 2)
+        border_rect = pygame.Rect(0, 0, garden_width_px, garden_height_px)
+
+        # NOTE: Grid lines end on the far edge, so leave one extra pixel for them
+        surface = pygame.Surface((math.ceil(garden_width_px) + 1, math.ceil(garden_height_px) + 1))
+        surface.fill(self.bg_color)
+        pygame.draw.rect(surface, (0, 0, 0), border_rect, 2)
 
         for i in range(1, int(self.garden.width)):
-            x = self.offset_x + i * self.scale_x
-            pygame.draw.line(
-                self.screen,
-                self.grid_color,
-                (x, self.offset_y),
-                (x, self.offset_y + garden_height_px),
-            )
+            x = i * self.scale_x
+            pygame.draw.line(surface, self.grid_color, (x, 0), (x, garden_height_px))
 
         for i in range(1, int(self.garden.height)):
-            y = self.offset_y + i * self.scale_y
-            pygame.draw.line(
-                self.screen,
-                self.grid_color,
-                (self.offset_x, y),
-                (self.offset_x + garden_width_px, y),
-            )
+            y = i * self.scale_y
+            pygame.draw.line(surface, self.grid_color, (0, y), (garden_width_px, y))
+
+        return surface
+
+    def _render_background(self) -> pygame.Surface:
+        """Render the background fill and grid once."""
+        background = pygame.Surface((self.width, self.height)).convert()
+        background.fill(self.bg_color)
+        background.blit(self._render_grid_surface(), (self.offset_x, self.offset_y))
+        return background
+
+    def _render_interactions(self) -> tuple[pygame.Surface, pygame.Rect]:
+        """Render all interaction lines into a transparent overlay and their bounding box."""
+        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        bounds = pygame.Rect(0, 0, 0, 0)
+
+        screen_pos = self._screen_positions()
+        pair_i, pair_j = self.garden.interaction_index()
+        for i, j in zip(pair_i.tolist(), pair_j.tolist(), strict=True):
+            pos1, pos2 = screen_pos[i], screen_pos[j]
+            rect = pygame.draw.line(overlay, self.interaction_line_color, pos1, pos2, 2)
+            bounds = rect if not bounds else bounds.union(rect)
+
+        return overlay.convert_alpha(), bounds
 
     def draw_interactions(self):
         """Draw lines between interacting plants."""
-        for plant1, plant2 in self.garden.get_all_interactions():
-            pos1 = self.garden_to_screen(plant1.position.x, plant1.position.y)
-            pos2 = self.garden_to_screen(plant2.position.x, plant2.position.y)
-            pygame.draw.line(self.screen, self.interaction_line_color, pos1, pos2, 2)
+        pair_index = self.garden.interaction_index()
+        if pair_index is not self._interaction_key:
+            # NOTE: Pairs only change with the plant layout, so the lines are redrawn then
+            self._interaction_overlay = self._render_interactions()
+            self._interaction_key = pair_index
+
+        overlay, bounds = self._interaction_overlay
+        if bounds:
+            self._dirty.append(self.screen.blit(overlay, bounds, area=bounds))
+
+    def _plant_sprite(
+        self, species_idx: int, root_radius: int, plant_radius: int
+    ) -> pygame.Surface:
+        """Return the plant drawing for this species and radii, rendering it on first use."""
+        key = (species_idx, root_radius, plant_radius)
+        sprite = self._plant_sprites.get(key)
+        if sprite is None:
+            half = max(root_radius, plant_radius) + 2
+            center = (half, half)
+            color = self.species_colors[Species(species_idx + 1)]
+
+            sprite = pygame.Surface((2 * half + 1, 2 * half + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, center, root_radius, 2)
+            pygame.draw.circle(sprite, color, center, plant_radius)
+            pygame.draw.circle(sprite, (0, 0, 0), center, plant_radius, 1)
+
+            sprite = sprite.convert_alpha()
+            self._plant_sprites[key] = sprite
+
+        return sprite
 
     def draw_plants(self):
         """Draw all plants in the garden."""
-        for plant in self.garden.plants:
-            pos = self.garden_to_screen(plant.position.x, plant.position.y)
-            color = self.species_colors[plant.variety.species]
-            root_radius = int(plant.variety.radius * min(self.scale_x, self.scale_y))
-            pygame.draw.circle(self.screen, color, pos, root_radius, 2)
+        table = self.garden.table
 
-            growth_ratio = plant.size / plant.max_size if plant.max_size > 0 else 0
-            min_radius, max_radius = 5, root_radius * 0.9
-            plant_radius = int(min_radius + growth_ratio * (max_radius - min_radius))
-
-            pygame.draw.circle(self.screen, color, pos, plant_radius)
-            pygame.draw.circle(self.screen, (0, 0, 0), pos, plant_radius, 1)
+        # NOTE: Radii for every plant at once from the garden's plant table
+        root_radius = (table.radius * min(self.scale_x, self.scale_y)).astype(np.int64)
+        growth_ratio = np.divide(
+            table.size, table.max_size, out=np.zeros(len(table)), where=table.max_size > 0
+        )
+        min_radius, max_radius = 5, root_radius * 0.9
+        plant_radius = (min_radius + growth_ratio * (max_radius - min_radius)).astype(np.int64)
+
+        blits = []
+        for species_idx, root_r, plant_r, pos in zip(
+            table.species_idx.tolist(),
+            root_radius.tolist(),
+            plant_radius.tolist(),
+            self._screen_positions(),
+            strict=True,
+        ):
+            sprite = self._plant_sprite(species_idx, root_r, plant_r)
+            blits.append((sprite, sprite.get_rect(center=pos)))
+
+        self._dirty.extend(self.screen.blits(blits))
 
     def draw_debug_info(self):
         """NEW: Draw detailed plant information when debug mode is active."""
         if not self.debug_mode:
             return
 
-        for plant in self.garden.plants:
-            pos = self.garden_to_screen(plant.position.x, plant.position.y)
-
-            # Get coefficients
-            coeffs = plant.variety.nutrient_coefficients
-            r_coeff = coeffs[Micronutrient.R]
-            g_coeff = coeffs[Micronutrient.G]
-            b_coeff = coeffs[Micronutrient.B]
-
-            # Create debug text lines
-            debug_lines = [
-                f'#{plant.variety.name[:10]}',
-                f'Size: {plant.size:.1f}/{plant.max_size}',
-                f'R:{plant.micronutrient_inventory[Micronutrient.R]:.1f}',
-                f'G:{plant.micronutrient_inventory[Micronutrient.G]:.1f}',
-                f'B:{plant.micronutrient_inventory[Micronutrient.B]:.1f}',
-                f'Cap: {plant.reservoir_capacity}',
-                f'Coef: ({r_coeff:+.1f},{g_coeff:+.1f},{b_coeff:+.1f})',
-            ]
+        table = self.garden.table
 
+        for plant, pos, size, inventory in zip(
+            self.garden.plants,
+            self._screen_positions(),
+            table.size.tolist(),
+            table.inventory.tolist(),
+            strict=True,
+        ):
             # Draw semi-transparent background
-            line_height = 18
-            box_height = len(debug_lines) * line_height + 10
-            box_width = 150
+            box_width, box_height = self._debug_box.get_size()
             box_x = pos[0] + 25
             box_y = pos[1] - box_height // 2
-
-            # Create surface with transparency
-            debug_surface = pygame.Surface((box_width, box_height))
-            debug_surface.set_alpha(235)
-            debug_surface.fill((255, 255, 230))
-            self.screen.blit(debug_surface, (box_x, box_y))
+            self.screen.blit(self._debug_box, (box_x, box_y))
 
             # Draw border
-            pygame.draw.rect(self.screen, (0, 0, 0), (box_x, box_y, box_width, box_height), 1)
+            self._dirty.append(
+                pygame.draw.rect(self.screen, (0, 0, 0), (box_x, box_y, box_width, box_height), 1)
+            )
 
             # Draw text lines
-            for i, line in enumerate(debug_lines):
-                text = self.tiny_font.render(line, True, (0, 0, 0))
-                self.screen.blit(text, (box_x + 5, box_y + 5 + i * line_height))
-
-    def draw_info_panel(self):
-        """Draw all UI text including stats, controls, and legend."""
-        info_pane_x = self.width - self.padding - 170
-        y_offset = self.offset_y
+            texts = self._render_debug_lines(plant, (size, *inventory))
+            self.screen.blits(
+                [
+                    (text, (box_x + 5, box_y + 5 + i * DEBUG_LINE_HEIGHT))
+                    for i, text in enumerate(texts)
+                ],
+                doreturn=False,
+            )
 
-        # Draw simulation stats
-        info_lines = [
-            f'{self.gardener}',
-            f'Turn: {self.turn}',
-            f'Total Growth: {self.garden.total_growth():.2f}',
-            f'Plants: {len(self.garden.plants)}',
-            '',
-            f'{"PAUSED" if self.paused else "RUNNING"}',
-            f'{"DEBUG ON" if self.debug_mode else "DEBUG OFF"}',  # NEW: Show debug status
+    def _render_debug_lines(
+        self, plant: Plant, state: tuple[float, float, float, float]
+    ) -> list[pygame.Surface]:
+        """Render a plant's debug lines, reusing the previous surfaces if its state is unchanged."""
+        # NOTE: Only size and inventory change between frames, the text is built on a change
+        cached = self._debug_text.get(id(plant))
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        size, r, g, b = state
+        coeffs = plant.variety.nutrient_coefficients
+        r_coeff = coeffs[Micronutrient.R]
+        g_coeff = coeffs[Micronutrient.G]
+        b_coeff = coeffs[Micronutrient.B]
+
+        # Create debug text lines
+        debug_lines = [
+            f'#{plant.variety.name[:10]}',
+            f'Size: {size:.1f}/{plant.max_size}',
+            f'R:{r:.1f}',
+            f'G:{g:.1f}',
+            f'B:{b:.1f}',
+            f'Cap: {plant.reservoir_capacity}',
+            f'Coef: ({r_coeff:+.1f},{g_coeff:+.1f},{b_coeff:+.1f})',
         ]
-        for line in info_lines:
-            if line:  # Skip empty debug line when not in debug mode
-                text = self.small_font.render(line, True, (0, 0, 0))
-                self.screen.blit(text, (info_pane_x, y_offset))
-                y_offset += 30
+        texts = [self.tiny_font.render(line, True, (0, 0, 0)) for line in debug_lines]
+        self._debug_text[id(plant)] = (state, texts)
+
+        return texts
+
+    def _render_static_panel(
+        self,
+    ) -> tuple[
+        list[tuple[pygame.Surface, tuple[int, int]]],
+        list[tuple[tuple[int, int, int], tuple[int, int]]],
+    ]:
+        """Render the controls and species legend text once, with the legend marker centers."""
+        texts = []
+        markers = []
+        info_pane_x = self.width - self.padding - 170
 
-        y_offset += 20
+        # NOTE: Stats take one 30px row per non-empty line, see draw_info_panel
+        num_stat_lines = 6 if self.gardener else 5
+        y_offset = self.offset_y + num_stat_lines * 30 + 20
 
         # Draw controls
         control_lines = [
@@ -183,14 +299,14 @@ class GardenVisualizer:
         ]
         for line in control_lines:
             text = self.small_font.render(line, True, (0, 0, 0))
-            self.screen.blit(text, (info_pane_x, y_offset))
+            texts.append((text, (info_pane_x, y_offset)))
             y_offset += 30
 
         y_offset += 20
 
         # Draw species legend
         title = self.font.render('Species:', True, (0, 0, 0))
-        self.screen.blit(title, (info_pane_x, y_offset))
+        texts.append((title, (info_pane_x, y_offset)))
         y_offset += 40
 
         for species, color in self.species_colors.items():
@@ -198,12 +314,51 @@ class GardenVisualizer:
             text = self.small_font.render(name, True, (0, 0, 0))
 
             circle_y = y_offset + text.get_height() // 2
-            pygame.draw.circle(self.screen, color, (info_pane_x + 15, circle_y), 10)
-            pygame.draw.circle(self.screen, (0, 0, 0), (info_pane_x + 15, circle_y), 10, 1)
+            markers.append((color, (info_pane_x + 15, circle_y)))
 
-            self.screen.blit(text, (info_pane_x + 35, y_offset))
+            texts.append((text, (info_pane_x + 35, y_offset)))
             y_offset += 35
 
+        return texts, markers
+
+    def draw_info_panel(self):
+        """Draw the simulation stats, controls and species legend."""
+        info_pane_x = self.width - self.padding - 170
+        y_offset = self.offset_y
+
+        # Draw simulation stats
+        info_lines = [
+            f'{self.gardener}',
+            f'Turn: {self.turn}',
+            f'Total Growth: {self.garden.total_growth():.2f}',
+            f'Plants: {len(self.garden.plants)}',
+            '',
+            f'{"PAUSED" if self.paused else "RUNNING"}',
+            f'{"DEBUG ON" if self.debug_mode else "DEBUG OFF"}',  # NEW: Show debug status
+        ]
+        blits = []
+        for line in info_lines:
+            if line:  # Skip empty debug line when not in debug mode
+                blits.append((self._render_stat_line(len(blits), line), (info_pane_x, y_offset)))
+                y_offset += 30
+
+        self._dirty.extend(self.screen.blits(blits))
+
+        # Draw controls and species legend
+        self._dirty.extend(self.screen.blits(self._panel_text))
+        for color, center in self._panel_markers:
+            self._dirty.append(pygame.draw.circle(self.screen, color, center, 10))
+            pygame.draw.circle(self.screen, (0, 0, 0), center, 10, 1)
+
+    def _render_stat_line(self, slot: int, line: str) -> pygame.Surface:
+        """Render a stats line, reusing the previous surface if its text is unchanged."""
+        cached = self._stat_text.get(slot)
+        if cached is None or cached[0] != line:
+            cached = (line, self.small_font.render(line, True, (0, 0, 0)))
+            self._stat_text[slot] = cached
+
+        return cached[1]
+
     def handle_events(self):
         """Handle pygame events."""
         for event in pygame.event.get():
@@ -211,13 +366,19 @@ class GardenVisualizer:
                 event.type == pygame.KEYDOWN and event.key == pygame.K_q
             ):
                 self.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                # NOTE: The window contents may be lost, repaint all of it
+                self._prev_dirty = None
+                self._needs_redraw = True
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
                     self.paused = not self.paused
+                    self._needs_redraw = True
                 elif event.key == pygame.K_RIGHT and self.paused:
                     self.step_simulation()
                 elif event.key == pygame.K_d:  # NEW: Toggle debug mode
                     self.debug_mode = not self.debug_mode
+                    self._needs_redraw = True
 
     def step_simulation(self):
         """Run one turn of simulation."""
@@ -227,23 +388,42 @@ class GardenVisualizer:
         else:
             self.paused = True
 
+        self._needs_redraw = True
+
+    def _update_display(self):
+        """Push only the regions drawn this frame or the last one to the window."""
+        if self._prev_dirty is None:
+            pygame.display.flip()
+        else:
+            # NOTE: Last frame's regions are included so anything no longer drawn is cleared
+            pygame.display.update(self._dirty + self._prev_dirty)
+
+        self._prev_dirty = self._dirty
+        self._dirty = []
+
     def run(self):
         """Main visualization loop."""
         while self.running:
             self.handle_events()
 
-            if not self.paused:
+            # NOTE: Simulate one turn per SIMULATION_STEP_MS while rendering at up to 60 FPS;
+            # a slow turn never queues up more than one extra step
+            if not self.paused and self._sim_accum >= SIMULATION_STEP_MS:
                 self.step_simulation()
-                self.clock.tick(10)
+                self._sim_accum = min(self._sim_accum - SIMULATION_STEP_MS, SIMULATION_STEP_MS)
 
-            self.screen.fill(self.bg_color)
-            self.draw_grid()
-            self.draw_plants()
-            self.draw_interactions()
-            self.draw_info_panel()
-            self.draw_debug_info()
+            # NOTE: The scene only changes on input or a simulation step
+            if self._needs_redraw:
+                self.screen.blit(self._background, (0, 0))
+                self.draw_plants()
+                self.draw_interactions()
+                self.draw_info_panel()
+                self.draw_debug_info()
 
-            pygame.display.flip()
-            self.clock.tick(60)
+                self._update_display()
+                self._needs_redraw = False
+
+            elapsed = self.clock.tick(60)
+            self._sim_accum = self._sim_accum + elapsed if not self.paused else 0.0
 
         pygame.quit()
@@ -1,6 +1,9 @@
+import importlib
 import multiprocessing
+import pickle
 import sys
 import time
+from collections import defaultdict, deque
 from concurrent.futures import ProcessPoolExecutor, TimeoutError, wait
 
 from core.engine import Engine
@@ -8,13 +11,23 @@ from core.garden import Garden
 from core.gardener import Gardener
 from core.plants.plant_variety import PlantVariety
 
+# NOTE: Strategy modules imported by the workers, preloaded so forked workers inherit them
+STRATEGY_MODULES = {
+    'fixed_k': 'gardeners.group1.gardener_fixed_k',
+    'hybrid': 'gardeners.group1.gardener_hybrid',
+    'mixed_k': 'gardeners.group1.gardener_mixed_k',
+    'prev': 'gardeners.group1.gardener_prev',
+}
 
-def _run_strategy_worker(strategy_name, garden_width, garden_height, varieties_data, params):
+
+def _run_strategy_worker(strategy_name, garden_width, garden_height, varieties_blob, params):
     """
     Worker function to run a single strategy in a separate process.
     Returns: (strategy_name, score, plant_placements) or None if failed
     """
     try:
+        varieties_data = pickle.loads(varieties_blob)
+
         from core.micronutrients import Micronutrient
         from core.plants.species import Species
 
@@ -31,11 +44,15 @@ def _run_strategy_worker(strategy_name, garden_width, garden_height, varieties_d
             return None
 
         # Reconstruct PlantVariety objects from serialized data
+        # NOTE: Enum members by name from plain dicts, skipping the enum lookup per variety
+        species_by_name = {species.name: species for species in Species}
+        nutrient_by_name = {nutrient.name: nutrient for nutrient in Micronutrient}
+
         varieties = []
         for v_data in varieties_data:
-            species = Species[v_data['species']]
+            species = species_by_name[v_data['species']]
             nutrient_coefficients = {
-                Micronutrient[nut_name]: coef
+                nutrient_by_name[nut_name]: coef
                 for nut_name, coef in v_data['nutrient_coefficients'].items()
             }
             variety = PlantVariety(
@@ -82,6 +99,15 @@ def _run_strategy_worker(strategy_name, garden_width, garden_height, varieties_d
         return (strategy_name, -1, [])  # Negative score indicates failure
 
 
+def _variety_key(v_data: dict) -> tuple:
+    """Hashable identity of a serialized variety: species, radius and nutrient coefficients."""
+    return (
+        v_data['species'],
+        v_data['radius'],
+        tuple(sorted(v_data['nutrient_coefficients'].items())),
+    )
+
+
 class Gardener1(Gardener):
     """
     META-STRATEGY: Run 3 best strategies IN PARALLEL and pick the best one.
@@ -124,6 +150,9 @@ class Gardener1(Gardener):
             }
             varieties_data.append(v_data)
 
+        # NOTE: Pickled once here, each worker submission then only copies the bytes
+        varieties_blob = pickle.dumps(varieties_data, protocol=pickle.HIGHEST_PROTOCOL)
+
         # Define strategies to test
         # Note: 'prev' excluded as it can timeout on large configs
         strategies = ['fixed_k', 'hybrid', 'mixed_k']
@@ -133,6 +162,9 @@ class Gardener1(Gardener):
         # Run strategies in parallel using ProcessPoolExecutor
         # Use 'fork' context on Unix for better compatibility
         mp_context = multiprocessing.get_context('fork') if sys.platform != 'win32' else None
+        if mp_context is not None:
+            for strategy_name in strategies:
+                importlib.import_module(STRATEGY_MODULES[strategy_name])
         with ProcessPoolExecutor(max_workers=3, mp_context=mp_context) as executor:
             # Submit all strategies
             futures = {
@@ -141,7 +173,7 @@ class Gardener1(Gardener):
                     strategy_name,
                     self.garden.width,
                     self.garden.height,
-                    varieties_data,
+                    varieties_blob,
                     self.params,
                 ): strategy_name
                 for strategy_name in strategies
@@ -191,47 +223,23 @@ class Gardener1(Gardener):
         best_result = results[best_strategy]
 
         # Apply winner's placements to actual garden
-        from core.micronutrients import Micronutrient
-        from core.plants.species import Species
         from core.point import Position
 
-        # Track which varieties have been used (by index in self.varieties list)
-        used_variety_indices = set()
+        # Index our varieties (by position in self.varieties) under their serialized attributes,
+        # matching placements reuse the earliest variety that hasn't been used yet
+        unused_variety_indices = defaultdict(deque)
+        for idx, v_data in enumerate(varieties_data):
+            unused_variety_indices[_variety_key(v_data)].append(idx)
 
         for placement_dict in best_result['placements']:
-            # Reconstruct species and nutrients from serialized data
-            species = Species[placement_dict['species']]
-            nutrient_coefficients = {
-                Micronutrient[nut_name]: coef
-                for nut_name, coef in placement_dict['nutrient_coefficients'].items()
-            }
-
-            # Find matching variety from our list (same species, radius, nutrients)
-            # that hasn't been used yet
-            matching_variety = None
-            matching_index = None
-            for idx, v in enumerate(self.varieties):
-                if idx in used_variety_indices:
-                    continue  # Skip already used varieties
-
-                if v.species == species and v.radius == placement_dict['radius']:
-                    # Check nutrient coefficients match
-                    nutrients_match = True
-                    for nut, coef in v.nutrient_coefficients.items():
-                        if abs(nutrient_coefficients.get(nut, 0) - coef) > 0.001:
-                            nutrients_match = False
-                            break
-                    if nutrients_match:
-                        matching_variety = v
-                        matching_index = idx
-                        break
-
-            if matching_variety:
+            matching_indices = unused_variety_indices.get(_variety_key(placement_dict))
+            if matching_indices:
+                matching_variety = self.varieties[matching_indices[0]]
                 x, y = placement_dict['position']
                 pos = Position(x, y)
                 if self.garden.can_place_plant(matching_variety, pos):
                     self.garden.add_plant(matching_variety, pos)
-                    used_variety_indices.add(matching_index)  # Mark as used
+                    matching_indices.popleft()  # Mark as used
 
     def _fallback_strategy(self):
         """
@@ -1,12 +1,81 @@
+import functools
+import itertools
 import math
+import multiprocessing
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
-from core.garden import Garden
+import numpy as np
+
+from core.engine import Engine
+from core.garden import Garden, within_distance
 from core.gardener import Gardener
+from core.kernels import HAS_NUMBA, njit
 from core.micronutrients import Micronutrient
 from core.plants.plant_variety import PlantVariety
 from core.plants.species import Species
 from core.point import Position
 
+# NOTE: Below this many varieties the grid trials run in-process, a fork costs more than a trial
+PARALLEL_TRIAL_MIN_VARIETIES = 400
+
+
+def _grid_steps(start: float, stop: float, step: float) -> np.ndarray:
+    """Values start, start + step, ... up to stop, accumulated step by step like a while loop."""
+    # NOTE: cumsum adds sequentially, so values match repeated += exactly
+    values = np.cumsum(np.concatenate(([start], np.full(math.ceil(stop / step) + 1, step))))
+    return values[values <= stop]
+
+
+@functools.cache
+def _hexagonal_grid(width: float, height: float, grid_spacing: float) -> np.ndarray:
+    """Hexagonal grid coordinates in row order as a read-only (N, 2) array."""
+    hex_height = grid_spacing * math.sqrt(3) / 2
+    ys = _grid_steps(0.0, height, hex_height)
+
+    # Alternate row offset for hexagonal packing, rows are padded to a common length
+    even_xs = _grid_steps(0.0, width, grid_spacing)
+    odd_xs = _grid_steps(grid_spacing / 2, width, grid_spacing)
+    padded_xs = np.full((2, max(len(even_xs), len(odd_xs))), np.nan)
+    padded_xs[0, : len(even_xs)] = even_xs
+    padded_xs[1, : len(odd_xs)] = odd_xs
+
+    row_xs = padded_xs[np.arange(len(ys)) % 2]
+    valid = ~np.isnan(row_xs)
+    grid = np.column_stack((row_xs[valid], np.broadcast_to(ys[:, None], valid.shape)[valid]))
+    grid.flags.writeable = False
+    return grid
+
+
+@functools.cache
+def _square_grid(width: float, height: float, grid_spacing: float) -> np.ndarray:
+    """Square grid coordinates in row order as a read-only (N, 2) array."""
+    xs = _grid_steps(0.0, width, grid_spacing)
+    ys = _grid_steps(0.0, height, grid_spacing)
+
+    grid = np.column_stack((np.tile(xs, len(ys)), np.repeat(ys, len(xs))))
+    grid.flags.writeable = False
+    return grid
+
+
+@njit(cache=True)
+def _cross_species_counts_kernel(
+    xy: np.ndarray, others_xy: np.ndarray, interaction_dist: np.ndarray
+) -> np.ndarray:
+    """Compiled Gardener1f._cross_species_counts, one pass over positions and placements."""
+    counts = np.zeros(xy.shape[0], dtype=np.int64)
+
+    for a in range(xy.shape[0]):
+        for b in range(others_xy.shape[0]):
+            dx = xy[a, 0] - others_xy[b, 0]
+            dy = xy[a, 1] - others_xy[b, 1]
+            if math.sqrt(dx * dx + dy * dy) < interaction_dist[b]:
+                counts[a] += 1
+
+    return counts
+
 
 class Gardener1f(Gardener):
     """
@@ -23,6 +92,19 @@ class Gardener1f(Gardener):
             Species.GERANIUM: Micronutrient.G,
             Species.BEGONIA: Micronutrient.B,
         }
+        self._best_k_groups: tuple[int, list[list[PlantVariety]]] | None = None
+
+        # NOTE: Rows follow self.varieties, coefficient columns are [R, G, B]
+        self._variety_index = {id(v): i for i, v in enumerate(self.varieties)}
+        self._coef = np.array(
+            [[v.nutrient_coefficients[n] for n in Micronutrient] for v in self.varieties],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        self._radii = np.array([v.radius for v in self.varieties], dtype=np.int64)
+        self._species_idx = np.array([v.species.value - 1 for v in self.varieties], dtype=np.int8)
+        self._nutrient_total = {
+            id(v): sum(v.nutrient_coefficients.values()) for v in self.varieties
+        }
 
     def _get_default_params(self) -> dict:
         return {
@@ -45,43 +127,15 @@ class Gardener1f(Gardener):
         self, grid_spacing: float, max_positions: int = 500
     ) -> list[Position]:
         """Generate hexagonal grid for efficient packing."""
-        positions = []
-        hex_height = grid_spacing * math.sqrt(3) / 2
-
-        y = 0
-        row = 0
-        while y <= self.garden.height and len(positions) < max_positions:
-            x_offset = (grid_spacing / 2) if row % 2 == 1 else 0
-            x = x_offset
-
-            while x <= self.garden.width and len(positions) < max_positions:
-                pos = Position(x, y)
-                if self.garden.within_bounds(pos):
-                    positions.append(pos)
-                x += grid_spacing
-
-            y += hex_height
-            row += 1
-
-        return positions
+        grid = _hexagonal_grid(self.garden.width, self.garden.height, grid_spacing)
+        return [Position(x, y) for x, y in grid[:max_positions].tolist()]
 
     def _generate_square_grid(
         self, grid_spacing: float, max_positions: int = 500
     ) -> list[Position]:
         """Generate square grid for alternative packing pattern."""
-        positions = []
-
-        y = 0
-        while y <= self.garden.height and len(positions) < max_positions:
-            x = 0
-            while x <= self.garden.width and len(positions) < max_positions:
-                pos = Position(x, y)
-                if self.garden.within_bounds(pos):
-                    positions.append(pos)
-                x += grid_spacing
-            y += grid_spacing
-
-        return positions
+        grid = _square_grid(self.garden.width, self.garden.height, grid_spacing)
+        return [Position(x, y) for x, y in grid[:max_positions].tolist()]
 
     def _evaluate_group_sustainability(self, group: list[PlantVariety]) -> float:
         """
@@ -96,13 +150,15 @@ class Gardener1f(Gardener):
         if not group:
             return 0.0
 
+        idx = np.fromiter((self._variety_index[id(v)] for v in group), dtype=np.intp)
+        radii = self._radii[idx]
+
         # Calculate total nutrient production
-        total_r = sum(v.nutrient_coefficients[Micronutrient.R] for v in group)
-        total_g = sum(v.nutrient_coefficients[Micronutrient.G] for v in group)
-        total_b = sum(v.nutrient_coefficients[Micronutrient.B] for v in group)
+        # NOTE: Summing over rows adds plants in group order, like the scalar sums did
+        total_r, total_g, total_b = self._coef[idx].sum(axis=0).tolist()
 
         # Calculate growth requirements: each plant needs 2*radius of each nutrient
-        total_requirement = sum(2 * v.radius for v in group)
+        total_requirement = 2 * int(radii.sum())
 
         # SUSTAINABILITY CHECK: Can production sustain continuous growth?
         if total_requirement > 0:
@@ -115,10 +171,11 @@ class Gardener1f(Gardener):
             min_sufficiency = 0.0
 
         # SPECIES DIVERSITY: Must have all 3 for exchanges
-        species_set = {v.species for v in group}
-        if len(species_set) == 3:
+        species_counts = np.bincount(self._species_idx[idx], minlength=3)
+        num_species = int(np.count_nonzero(species_counts))
+        if num_species == 3:
             species_bonus = self.params['species_bonus_all']
-        elif len(species_set) == 2:
+        elif num_species == 2:
             species_bonus = self.params['species_bonus_two']
         else:
             species_bonus = 0.0  # Can't exchange effectively
@@ -132,12 +189,13 @@ class Gardener1f(Gardener):
         balance_penalty = math.sqrt(variance) * self.params['balance_penalty_multiplier']
 
         # GROWTH POTENTIAL: Sum of max sizes (100*r^2 for each plant)
-        max_growth_potential = sum(100 * v.radius**2 for v in group)
+        max_growth_potential = 100 * int((radii * radii).sum())
 
         # EXCHANGE COMPATIBILITY: Different species can exchange
-        exchange_pairs = sum(
-            1 for i, v1 in enumerate(group) for v2 in group[i + 1 :] if v1.species != v2.species
-        )
+        # NOTE: All pairs minus the same-species pairs within each species
+        num_plants = len(group)
+        same_species_pairs = int((species_counts * (species_counts - 1)).sum()) // 2
+        exchange_pairs = num_plants * (num_plants - 1) // 2 - same_species_pairs
 
         # COMBINED SCORE
         score = (
@@ -198,44 +256,105 @@ class Gardener1f(Gardener):
         Always ensures species diversity.
         """
         groups = []
-        remaining = self.varieties.copy()
+        alive = np.ones(len(self.varieties), dtype=bool)
+        num_alive = len(self.varieties)
+        fill_key = [(v.radius, self._nutrient_total[id(v)]) for v in self.varieties]
 
         # Pre-sort by species
-        species_lists = {Species.RHODODENDRON: [], Species.GERANIUM: [], Species.BEGONIA: []}
-        for v in remaining:
-            species_lists[v.species].append(v)
+        # NOTE: Entries used as fillers stay queued and are skipped when they reach the front
+        species_lists = {species: deque() for species in Species}
+        for i, v in enumerate(self.varieties):
+            species_lists[v.species].append(i)
 
-        while remaining:
+        while num_alive:
             group = []
 
             # Priority: get all 3 species first
             for species in [Species.RHODODENDRON, Species.GERANIUM, Species.BEGONIA]:
-                if species_lists[species] and len(group) < k:
-                    plant = species_lists[species].pop(0)
-                    group.append(plant)
-                    remaining.remove(plant)
+                queue = species_lists[species]
+                while queue and not alive[queue[0]]:
+                    queue.popleft()
+
+                if queue and len(group) < k:
+                    group.append(queue.popleft())
+                    alive[group[-1]] = False
+                    num_alive -= 1
 
             # Fill remaining slots
-            while len(group) < k and remaining:
+            while len(group) < k and num_alive:
                 # Prefer larger radius plants (more growth potential)
-                best_plant = max(
-                    remaining[: min(20, len(remaining))],
-                    key=lambda v: (v.radius, sum(v.nutrient_coefficients.values())),
-                )
+                candidates = np.flatnonzero(alive)[:20].tolist()
+                best_plant = max(candidates, key=fill_key.__getitem__)
                 group.append(best_plant)
-                remaining.remove(best_plant)
-                if best_plant in species_lists[best_plant.species]:
-                    species_lists[best_plant.species].remove(best_plant)
+                alive[best_plant] = False
+                num_alive -= 1
 
             if group:
-                groups.append(group)
+                groups.append([self.varieties[i] for i in group])
             else:
                 break
 
         return groups
 
+    @staticmethod
+    def _positions_xy(positions: list[Position]) -> np.ndarray:
+        """Return the coordinates of the positions as an (N, 2) array."""
+        return np.array([(p.x, p.y) for p in positions], dtype=np.float64).reshape(-1, 2)
+
+    def _placeable_masks(self, xy: np.ndarray, garden: Garden) -> dict[int, np.ndarray]:
+        """Mask of positions that are in bounds and clear of every plant, per variety radius."""
+        x, y = xy[:, 0], xy[:, 1]
+        in_bounds = (x >= 0) & (x <= garden.width) & (y >= 0) & (y <= garden.height)
+
+        table = garden.table
+        if len(table):
+            dx = x[:, None] - table.position[:, 0]
+            dy = y[:, None] - table.position[:, 1]
+
+        masks = {}
+        for radius in {v.radius for v in self.varieties}:
+            masks[radius] = in_bounds.copy()
+            if len(table):
+                min_distance = np.maximum(radius, table.radius)
+                masks[radius] &= ~within_distance(dx, dy, min_distance).any(axis=1)
+
+        return masks
+
+    @staticmethod
+    def _mark_occupied(
+        masks: dict[int, np.ndarray], xy: np.ndarray, variety: PlantVariety, position: Position
+    ) -> None:
+        """Clear the positions blocked by a plant that was just added to the garden."""
+        dx = xy[:, 0] - position.x
+        dy = xy[:, 1] - position.y
+        for radius, mask in masks.items():
+            mask &= ~within_distance(dx, dy, max(radius, variety.radius))
+
+    def _cross_species_counts(
+        self,
+        variety: PlantVariety,
+        xy: np.ndarray,
+        placements: list[tuple[PlantVariety, Position]],
+    ) -> np.ndarray:
+        """Count placements of other species within interaction distance of each position."""
+        others = [(v, pos) for v, pos in placements if v.species != variety.species]
+        if not others:
+            return np.zeros(len(xy), dtype=np.int64)
+
+        others_xy = self._positions_xy([pos for _, pos in others])
+        interaction_dist = np.array(
+            [variety.radius + v.radius for v, _ in others], dtype=np.float64
+        )
+
+        if HAS_NUMBA:
+            return _cross_species_counts_kernel(xy, others_xy, interaction_dist)
+
+        dx = xy[:, 0, None] - others_xy[:, 0]
+        dy = xy[:, 1, None] - others_xy[:, 1]
+        return np.count_nonzero(np.sqrt(dx * dx + dy * dy) < interaction_dist, axis=1)
+
     def _run_phases_on_test_garden(
-        self, grid_positions: list[Position]
+        self, grid_positions: list[Position], grid_xy: np.ndarray
     ) -> tuple[list[tuple[PlantVariety, Position]], set[int]]:
         """
         Run Phase 1 and Phase 2 on a temporary test garden.
@@ -245,27 +364,56 @@ class Gardener1f(Gardener):
         test_garden = Garden(width=self.garden.width, height=self.garden.height)
 
         # Phase 1: Find optimal k and place initial groups
-        best_k, initial_groups = self._find_best_k_groups_dp()
+        # Grouping only depends on the varieties, so both grid trials share one result
+        if self._best_k_groups is None:
+            self._best_k_groups = self._find_best_k_groups_dp()
+        best_k, initial_groups = self._best_k_groups
         placements, used_ids = self._place_initial_groups_on_garden(
-            initial_groups, grid_positions, test_garden
+            initial_groups, grid_positions, grid_xy, test_garden
         )
 
         # Phase 2: Greedy cluster extension for remaining plants
         remaining_varieties = [v for v in self.varieties if id(v) not in used_ids]
         if remaining_varieties:
             self._greedy_cluster_extension_on_garden(
-                remaining_varieties, placements, grid_positions, test_garden
+                remaining_varieties, placements, grid_positions, grid_xy, test_garden
             )
 
         return (placements, used_ids)
 
+    def _run_grid_trial(
+        self, grid_positions: list[Position], grid_xy: np.ndarray
+    ) -> tuple[list[tuple[PlantVariety, Position]], set[int], float]:
+        """
+        Run phases 1-2 on one grid and simulate the result for a year.
+        Returns placements, used variety IDs and the growth.
+        """
+        placements, used_ids = self._run_phases_on_test_garden(grid_positions, grid_xy)
+
+        # Apply placements to test garden for simulation
+        test_garden = Garden(width=self.garden.width, height=self.garden.height)
+        for variety, pos in placements:
+            test_garden.add_plant(variety, pos)
+        score = self._simulate_and_score(test_garden, turns=365)
+
+        return (placements, used_ids, score)
+
     def _place_initial_groups_on_garden(
-        self, groups: list[list[PlantVariety]], grid_positions: list[Position], garden: Garden
+        self,
+        groups: list[list[PlantVariety]],
+        grid_positions: list[Position],
+        grid_xy: np.ndarray,
+        garden: Garden,
     ) -> tuple[list[tuple[PlantVariety, Position]], set[int]]:
         """Place initial k-groups on specified garden."""
         all_placements = []
         used_ids = set()
 
+        candidates = grid_positions[: min(200, len(grid_positions))]
+        candidate_xy = grid_xy[: len(candidates)]
+        # NOTE: The masks mirror Garden.can_place_plant, which stays as the final check
+        placeable = self._placeable_masks(candidate_xy, garden)
+
         for group in groups:
             sorted_group = sorted(group, key=lambda v: v.radius, reverse=True)
 
@@ -273,37 +421,31 @@ class Gardener1f(Gardener):
                 best_pos = None
                 best_score = -1
 
-                for pos in grid_positions[: min(200, len(grid_positions))]:
-                    if garden.can_place_plant(variety, pos):
-                        score = 0.0
-                        cross_species = 0
-
-                        recent = (
-                            all_placements[-20:] if len(all_placements) > 20 else all_placements
-                        )
-                        for placed_var, placed_pos in recent:
-                            dx = pos.x - placed_pos.x
-                            dy = pos.y - placed_pos.y
-                            dist = math.sqrt(dx * dx + dy * dy)
-                            interaction_dist = variety.radius + placed_var.radius
+                recent = all_placements[-20:] if len(all_placements) > 20 else all_placements
+                cross_counts = self._cross_species_counts(variety, candidate_xy, recent)
+                radius_score = variety.radius * 3.0
 
-                            if dist < interaction_dist and variety.species != placed_var.species:
-                                cross_species += 1
-                                score += 15.0
+                for pos, cross_species, is_free in zip(
+                    candidates,
+                    cross_counts.tolist(),
+                    placeable[variety.radius].tolist(),
+                    strict=True,
+                ):
+                    score = cross_species * 15.0 + radius_score
 
-                        score += variety.radius * 3.0
-
-                        if score > best_score:
-                            best_score = score
-                            best_pos = pos
+                    # NOTE: Only positions that would beat the best score need a placement check
+                    if score > best_score and is_free and garden.can_place_plant(variety, pos):
+                        best_score = score
+                        best_pos = pos
 
-                            if cross_species >= 2:
-                                break
+                        if cross_species >= 2:
+                            break
 
                 if best_pos:
                     garden.add_plant(variety, best_pos)
                     all_placements.append((variety, best_pos))
                     used_ids.add(id(variety))
+                    self._mark_occupied(placeable, candidate_xy, variety, best_pos)
 
         return (all_placements, used_ids)
 
@@ -312,45 +454,47 @@ class Gardener1f(Gardener):
         remaining: list[PlantVariety],
         existing_placements: list[tuple[PlantVariety, Position]],
         grid_positions: list[Position],
+        grid_xy: np.ndarray,
         garden: Garden,
     ) -> None:
         """Greedy cluster extension on specified garden."""
+        candidates = grid_positions[: min(150, len(grid_positions))]
+        candidate_xy = grid_xy[: len(candidates)]
+        placeable = self._placeable_masks(candidate_xy, garden)
+
         while remaining:
             best_variety = None
             best_pos = None
             best_score = -1
 
-            for variety in remaining[: min(30, len(remaining))]:
-                for pos in grid_positions[: min(150, len(grid_positions))]:
-                    if garden.can_place_plant(variety, pos):
-                        score = 0.0
-                        interactions = 0
-
-                        recent = existing_placements[-15:]
-                        for placed_var, placed_pos in recent:
-                            dx = pos.x - placed_pos.x
-                            dy = pos.y - placed_pos.y
-                            dist = math.sqrt(dx * dx + dy * dy)
-                            interaction_dist = variety.radius + placed_var.radius
+            recent = existing_placements[-15:]
+            for i, variety in enumerate(remaining[: min(30, len(remaining))]):
+                interaction_counts = self._cross_species_counts(variety, candidate_xy, recent)
+                radius_score = variety.radius * 2.0
 
-                            if dist < interaction_dist and variety.species != placed_var.species:
-                                interactions += 1
-                                score += 20.0
+                for pos, interactions, is_free in zip(
+                    candidates,
+                    interaction_counts.tolist(),
+                    placeable[variety.radius].tolist(),
+                    strict=True,
+                ):
+                    score = interactions * 20.0 + radius_score
 
-                        score += variety.radius * 2.0
-
-                        if score > best_score:
-                            best_score = score
-                            best_variety = variety
-                            best_pos = pos
+                    if score > best_score and is_free and garden.can_place_plant(variety, pos):
+                        best_score = score
+                        best_index = i
+                        best_variety = variety
+                        best_pos = pos
 
             if len(remaining) >= 3:
                 test_group = remaining[:3]
                 cluster_score = self._evaluate_group_sustainability(test_group)
 
                 if cluster_score > best_score * 0.8:
-                    for pos in grid_positions[:50]:
+                    free = placeable[test_group[0].radius][:50]
+                    for pos in itertools.compress(candidates[:50], free.tolist()):
                         if garden.can_place_plant(test_group[0], pos):
+                            best_index = 0
                             best_variety = test_group[0]
                             best_pos = pos
                             best_score = cluster_score
@@ -359,14 +503,13 @@ class Gardener1f(Gardener):
             if best_variety and best_pos:
                 garden.add_plant(best_variety, best_pos)
                 existing_placements.append((best_variety, best_pos))
-                remaining.remove(best_variety)
+                del remaining[best_index]
+                self._mark_occupied(placeable, candidate_xy, best_variety, best_pos)
             else:
                 break
 
     def _simulate_and_score(self, test_garden: Garden, turns: int = 100) -> float:
         """Run simulation on test garden and return final growth."""
-        from core.engine import Engine
-
         engine = Engine(test_garden)
         engine.run_simulation(turns)
         return test_garden.total_growth()
@@ -375,57 +518,66 @@ class Gardener1f(Gardener):
         self,
         remaining: list[PlantVariety],
         grid_positions: list[Position],
+        grid_xy: np.ndarray,
         time_budget: float = 20.0,
     ) -> None:
         """
         Phase 4: Gap-fill by maximizing cross-species interactions.
         Continues placing plants until time budget exhausted.
         """
-        import time
-
         start_time = time.time()
 
+        # NOTE: Counts only depend on radius and species, and each placement only adds the
+        # neighbours of the new plant, so they are kept per kind and updated incrementally
+        counts_by_kind: dict[tuple[int, Species], tuple[PlantVariety, np.ndarray]] = {}
+        placeable = self._placeable_masks(grid_xy, self.garden)
+
         while remaining and (time.time() - start_time < time_budget):
             best_variety = None
             best_pos = None
             best_score = -1
 
             # Try ALL remaining plants, find the one with best position
-            for variety in remaining:
+            for i, variety in enumerate(remaining):
                 if time.time() - start_time >= time_budget:
                     break
 
-                # Find best position for this specific plant
-                for pos in grid_positions:
-                    if not self.garden.can_place_plant(variety, pos):
-                        continue
-
-                    # Score based on cross-species interactions
-                    interaction_count = 0
-                    for existing_plant in self.garden.plants:
-                        if variety.species == existing_plant.variety.species:
-                            continue  # Same species don't interact
-
-                        dx = pos.x - existing_plant.position.x
-                        dy = pos.y - existing_plant.position.y
-                        distance = math.sqrt(dx * dx + dy * dy)
-                        interaction_distance = variety.radius + existing_plant.variety.radius
-
-                        if distance < interaction_distance:
-                            interaction_count += 1
+                # Score based on cross-species interactions
+                kind = (variety.radius, variety.species)
+                if kind not in counts_by_kind:
+                    placed = [(plant.variety, plant.position) for plant in self.garden.plants]
+                    counts_by_kind[kind] = (
+                        variety,
+                        self._cross_species_counts(variety, grid_xy, placed),
+                    )
+                interaction_counts = counts_by_kind[kind][1]
 
+                # Find best position for this specific plant
+                for pos, interaction_count, is_free in zip(
+                    grid_positions,
+                    interaction_counts.tolist(),
+                    placeable[variety.radius].tolist(),
+                    strict=True,
+                ):
                     # Score = interactions * 10 + radius
                     score = interaction_count * 10.0 + variety.radius * 1.0
 
-                    if score > best_score:
+                    if score > best_score and is_free and self.garden.can_place_plant(variety, pos):
                         best_score = score
+                        best_index = i
                         best_variety = variety
                         best_pos = pos
 
             # Place best plant found this iteration
             if best_variety and best_pos:
                 self.garden.add_plant(best_variety, best_pos)
-                remaining.remove(best_variety)
+                del remaining[best_index]
+                self._mark_occupied(placeable, grid_xy, best_variety, best_pos)
+
+                for kind_variety, counts in counts_by_kind.values():
+                    counts += self._cross_species_counts(
+                        kind_variety, grid_xy, [(best_variety, best_pos)]
+                    )
             else:
                 # No valid position for any remaining plant
                 break
@@ -466,31 +618,72 @@ class Gardener1f(Gardener):
                 if (pos.x, pos.y) not in existing_hex:
                     hex_grid.append(pos)
 
-        # Test Square Grid
-        test_garden_square = Garden(width=self.garden.width, height=self.garden.height)
-        placements_square, used_ids_square = self._run_phases_on_test_garden(square_grid)
-        # Apply placements to test garden for simulation
-        for variety, pos in placements_square:
-            test_garden_square.add_plant(variety, pos)
-        score_square = self._simulate_and_score(test_garden_square, turns=365)
+        square_xy = self._positions_xy(square_grid)
+        hex_xy = self._positions_xy(hex_grid)
+
+        # Phase 1 grouping only depends on the varieties, so it runs once for both trials
+        if self._best_k_groups is None:
+            self._best_k_groups = self._find_best_k_groups_dp()
+
+        # Test both grids, each trial runs phases 1-2 and a full simulation
+        trials = [(square_grid, square_xy), (hex_grid, hex_xy)]
+        # NOTE: Inside a worker (e.g. Gardener1's strategy pool) another pool would multiply
+        # processes, and small trials finish before a fork would pay off
+        if (
+            multiprocessing.parent_process() is not None
+            or len(self.varieties) < PARALLEL_TRIAL_MIN_VARIETIES
+        ):
+            results = [self._run_grid_trial(grid, grid_xy) for grid, grid_xy in trials]
+        else:
+            best_k, initial_groups = self._best_k_groups
+            group_indices = [
+                [self._variety_index[id(v)] for v in group] for group in initial_groups
+            ]
+
+            # Use 'fork' context on Unix for better compatibility
+            mp_context = multiprocessing.get_context('fork') if sys.platform != 'win32' else None
+            with ProcessPoolExecutor(max_workers=2, mp_context=mp_context) as executor:
+                futures = [
+                    executor.submit(
+                        _run_grid_trial_worker,
+                        grid,
+                        grid_xy,
+                        self.varieties,
+                        self.params,
+                        best_k,
+                        group_indices,
+                        self.garden.width,
+                        self.garden.height,
+                    )
+                    for grid, grid_xy in trials
+                ]
+                worker_results = [future.result() for future in futures]
+
+            # NOTE: Workers return varieties by index, map them back to this gardener's objects
+            results = [
+                (
+                    [(self.varieties[i], pos) for i, pos in placement_indices],
+                    {id(self.varieties[i]) for i in used_indices},
+                    score,
+                )
+                for placement_indices, used_indices, score in worker_results
+            ]
 
-        # Test Hexagonal Grid
-        test_garden_hex = Garden(width=self.garden.width, height=self.garden.height)
-        placements_hex, used_ids_hex = self._run_phases_on_test_garden(hex_grid)
-        # Apply placements to test garden for simulation
-        for variety, pos in placements_hex:
-            test_garden_hex.add_plant(variety, pos)
-        score_hex = self._simulate_and_score(test_garden_hex, turns=365)
+        square_result, hex_result = results
+        placements_square, used_ids_square, score_square = square_result
+        placements_hex, used_ids_hex, score_hex = hex_result
 
         # Pick winner and apply to actual garden
         if score_square > score_hex:
             winning_placements = placements_square
             winning_used_ids = used_ids_square
             winning_grid = square_grid
+            winning_xy = square_xy
         else:
             winning_placements = placements_hex
             winning_used_ids = used_ids_hex
             winning_grid = hex_grid
+            winning_xy = hex_xy
 
         # Apply winning placements to actual garden
         for variety, pos in winning_placements:
@@ -500,4 +693,33 @@ class Gardener1f(Gardener):
         remaining_varieties = [v for v in self.varieties if id(v) not in winning_used_ids]
 
         if remaining_varieties:
-            self._gap_fill_with_interactions(remaining_varieties, winning_grid, time_budget=20.0)
+            self._gap_fill_with_interactions(
+                remaining_varieties, winning_grid, winning_xy, time_budget=20.0
+            )
+
+
+def _run_grid_trial_worker(
+    grid_positions: list[Position],
+    grid_xy: np.ndarray,
+    varieties: list[PlantVariety],
+    params: dict,
+    best_k: int,
+    group_indices: list[list[int]],
+    width: float,
+    height: float,
+) -> tuple[list[tuple[int, Position]], list[int], float]:
+    """
+    Run Gardener1f._run_grid_trial in a worker process, with the parent's phase 1 groups.
+    Returns placements and used varieties as indices into varieties, and the growth.
+    """
+    gardener = Gardener1f(Garden(width=width, height=height), varieties, params)
+    gardener._best_k_groups = (best_k, [[varieties[i] for i in group] for group in group_indices])
+    placements, used_ids, score = gardener._run_grid_trial(grid_positions, grid_xy)
+
+    # NOTE: Varieties arrive as copies, so identities are only meaningful inside the worker
+    index = {id(v): i for i, v in enumerate(varieties)}
+    return (
+        [(index[id(variety)], pos) for variety, pos in placements],
+        [index[variety_id] for variety_id in used_ids],
+        score,
+    )
@@ -23,6 +23,7 @@ class Gardener1m(Gardener):
             Species.GERANIUM: Micronutrient.G,
             Species.BEGONIA: Micronutrient.B,
         }
+        self._best_k_groups: tuple[int, list[list[PlantVariety]]] | None = None
 
     def _get_default_params(self) -> dict:
         return {
@@ -282,7 +283,10 @@ class Gardener1m(Gardener):
         test_garden = Garden(width=self.garden.width, height=self.garden.height)
 
         # Phase 1: Find optimal k and place initial groups
-        best_k, initial_groups = self._find_best_k_groups_dp()
+        # Grouping only depends on the varieties, so both grid trials share one result
+        if self._best_k_groups is None:
+            self._best_k_groups = self._find_best_k_groups_dp()
+        best_k, initial_groups = self._best_k_groups
         placements, used_ids = self._place_initial_groups_on_garden(
             initial_groups, grid_positions, test_garden
         )
@@ -1,12 +1,120 @@
+import functools
+import itertools
 import math
+from collections import deque
+from collections.abc import Iterable
 
-from core.garden import Garden
+import numpy as np
+
+from core.garden import Garden, within_distance
 from core.gardener import Gardener
+from core.kernels import HAS_NUMBA, njit
 from core.micronutrients import Micronutrient
+from core.plants.plant_table import NUTRIENT_COLUMNS, PRODUCED_NUTRIENT
 from core.plants.plant_variety import PlantVariety
 from core.plants.species import Species
 from core.point import Position
 
+# NOTE: Candidate groups scored per numpy call in the limited combinatorial search
+COMBINATION_BATCH = 65536
+# NOTE: Larger searches switch from every combination to a beam of the best partial groups
+EXHAUSTIVE_SEARCH_LIMIT = 100_000
+BEAM_WIDTH = 32
+# NOTE: Placement distance ratios, compared on actual distances since packed positions sit
+# exactly at the thresholds where squared distances can round the other way
+PERFECT_PACKING_TOLERANCE = 0.01
+OPTIMAL_EXCHANGE_RATIO = 0.99
+# NOTE: Species sets are bitmasks over the species' produced nutrient column
+ALL_SPECIES = 0b111
+SPECIES_COUNT = np.array([mask.bit_count() for mask in range(ALL_SPECIES + 1)])
+
+
+@functools.cache
+def _polygonal_grid(width: float, height: float, grid_spacing: float) -> np.ndarray:
+    """Hexagonal grid coordinates as a read-only (N, 2) array, see _generate_polygonal_grid."""
+    # Hexagonal grid uses offset rows
+    # sqrt(3)/2 is around 0.866 is the vertical spacing factor for hex grids
+    hex_height = grid_spacing * math.sqrt(3) / 2
+
+    # NOTE: Coordinates are accumulated step by step rather than multiplied out
+    ys = np.cumsum(
+        np.concatenate(([0.0], np.full(math.floor(height / hex_height) + 1, hex_height)))
+    )
+    ys = ys[ys <= height]
+
+    # Alternate row offset for hexagonal packing, rows are padded to a common length
+    steps = np.full(math.ceil(width / grid_spacing) + 1, grid_spacing)
+    row_xs = np.cumsum(np.array([[0.0, *steps], [grid_spacing / 2, *steps]]), axis=1)
+    row_valid = (row_xs >= 0) & (row_xs <= width)
+
+    parity = np.arange(len(ys)) % 2
+    valid = row_valid[parity]
+    xs = row_xs[parity][valid]
+    grid = np.column_stack((xs, np.broadcast_to(ys[:, None], valid.shape)[valid]))
+    grid.flags.writeable = False
+    return grid
+
+
+@njit(cache=True)
+def _score_positions_kernel(
+    xy: np.ndarray,
+    placed_xy: np.ndarray,
+    placed_radius: np.ndarray,
+    is_cross_species: np.ndarray,
+    complementary: np.ndarray,
+    radius: float,
+    cross_species_weight: float,
+    optimal_distance_weight: float,
+    min_distance_weight: float,
+    radius_weight: float,
+    partner_penalty_multiplier: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compiled Gardener1Prev._score_positions, one pass over positions and placed plants."""
+    num_positions = xy.shape[0]
+    score = np.empty(num_positions)
+    packing_only_score = np.empty(num_positions)
+    cross_species_count = np.zeros(num_positions, dtype=np.int64)
+
+    for a in range(num_positions):
+        min_distance_bonus = 0.0
+        optimal_distance_bonus = 0.0
+        interaction_count = 0
+        cross_count = 0
+
+        for b in range(placed_xy.shape[0]):
+            dx = xy[a, 0] - placed_xy[b, 0]
+            dy = xy[a, 1] - placed_xy[b, 1]
+            distance = math.sqrt(dx * dx + dy * dy)
+            min_required_distance = max(radius, placed_radius[b])
+            interaction_distance = radius + placed_radius[b]
+
+            if (
+                distance >= min_required_distance
+                and abs(distance / min_required_distance - 1.0) < PERFECT_PACKING_TOLERANCE
+            ):
+                min_distance_bonus += 3.0
+
+            if distance < interaction_distance:
+                interaction_count += 1
+                if is_cross_species[b]:
+                    cross_count += 1
+                    if distance / interaction_distance >= OPTIMAL_EXCHANGE_RATIO:
+                        optimal_distance_bonus += 3.0
+                    optimal_distance_bonus += complementary[b]
+
+        partner_penalty = (cross_count - 3) * partner_penalty_multiplier if cross_count > 3 else 0
+        score[a] = (
+            cross_count * cross_species_weight
+            + optimal_distance_bonus * optimal_distance_weight
+            + min_distance_bonus * min_distance_weight
+            + radius * radius_weight
+            - partner_penalty
+        )
+        packing_only_score[a] = min_distance_bonus + interaction_count * 0.5
+        cross_species_count[a] = cross_count
+
+    return score, packing_only_score, cross_species_count
+
 
 class Gardener1Prev(Gardener):
     def __init__(self, garden: Garden, varieties: list[PlantVariety], params: dict | None = None):
@@ -14,6 +122,31 @@ class Gardener1Prev(Gardener):
         # Default parameters (can be overridden)
         self.params = params or self._get_default_params()
 
+        # NOTE: Structure-of-arrays copy of the varieties for group scoring, rows follow
+        # self.varieties and nutrient columns follow Micronutrient order
+        self._variety_index = {id(v): i for i, v in enumerate(self.varieties)}
+        self._coef = np.array(
+            [[v.nutrient_coefficients[n] for n in Micronutrient] for v in self.varieties],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        self._radii = np.array([v.radius for v in self.varieties], dtype=np.float64)
+        self._max_coef = self._coef.max(axis=1)
+        self._produced = np.array(
+            [NUTRIENT_COLUMNS[PRODUCED_NUTRIENT[v.species]] for v in self.varieties],
+            dtype=np.int64,
+        )
+        # NOTE: Species map one-to-one onto their produced nutrient, so it doubles as species id;
+        # each variety has its species bit set and its own-nutrient production in that column
+        self._species_bit = 1 << self._produced
+        is_species = self._produced[:, None] == np.arange(3)
+        own_production = self._coef[np.arange(len(self.varieties)), self._produced]
+        self._species_production = own_production[:, None] * is_species
+        # NOTE: Group scores keyed by sorted variety indices, the evaluator is pure
+        self._group_scores: dict[tuple[int, ...], float] = {}
+        # NOTE: Scratch buffers for the numpy position scorer, reused across placements
+        self._distance_buffer = np.empty((2, 0, 0), dtype=np.float64)
+        self._mask_buffer = np.empty((2, 0, 0), dtype=bool)
+
     def _get_default_params(self) -> dict:
         """Default parameter values (tuned from comprehensive parameter sweep)."""
         return {
@@ -34,7 +167,7 @@ class Gardener1Prev(Gardener):
             'partner_penalty_multiplier': 2.0,  # Penalty for too many partners
         }
 
-    def _generate_polygonal_grid(self, grid_spacing: float = 1.0) -> list[Position]:
+    def _generate_polygonal_grid(self, grid_spacing: float = 1.0) -> np.ndarray:
         """
         Generate a polygonal (hexagonal-like) grid of candidate positions.
         Hexagonal packing is more efficient than square grids for circular plants.
@@ -43,33 +176,81 @@ class Gardener1Prev(Gardener):
             grid_spacing: Distance between grid points
 
         Returns:
-            List of Position objects forming a hexagonal grid
+            Array of (x, y) rows forming a hexagonal grid, shared between calls
         """
-        positions = []
+        return _polygonal_grid(self.garden.width, self.garden.height, grid_spacing)
 
-        # Hexagonal grid uses offset rows
-        # sqrt(3)/2 is around 0.866 is the vertical spacing factor for hex grids
-        hex_height = grid_spacing * math.sqrt(3) / 2
+    def _evaluate_group_balance(self, group: list[PlantVariety]) -> float:
+        """Score a single group of varieties, see _evaluate_groups."""
+        if not group:
+            return 0.0
 
-        y = 0
-        row = 0
-        while y <= self.garden.height:
-            # Alternate row offset for hexagonal packing
-            x_offset = (grid_spacing / 2) if row % 2 == 1 else 0
-            x = x_offset
+        group_idx = [self._variety_index[id(v)] for v in group]
+        key = tuple(sorted(group_idx))
+        if key not in self._group_scores:
+            self._group_scores[key] = float(self._evaluate_groups(np.array([group_idx]))[0])
 
-            while x <= self.garden.width:
-                pos = Position(x, y)
-                if self.garden.within_bounds(pos):
-                    positions.append(pos)
-                x += grid_spacing
+        return self._group_scores[key]
 
-            y += hex_height
-            row += 1
+    def _evaluate_groups(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Score groups of equal size given as rows of indices into self.varieties.
 
-        return positions
+        Returns:
+            Score per group representing group quality (higher is better)
+        """
+        return self._score_aggregates(*self._group_aggregates(idx))
 
-    def _evaluate_group_balance(self, group: list[PlantVariety]) -> float:
+    def _evaluate_extensions(self, group: list[int], candidates: list[int]) -> np.ndarray:
+        """Score group + [c] for every candidate c, reusing the group's aggregates."""
+        totals, max_req, total_req, species_mask, species_production = self._group_aggregates(
+            np.array([group], dtype=np.int64)
+        )
+
+        # NOTE: Each aggregate is a running sum or max, so adding the candidate last matches
+        # aggregating group + [c] from scratch exactly
+        candidate_requirements = 2 * self._radii[candidates]
+        return self._score_aggregates(
+            totals + self._coef[candidates],
+            np.maximum(max_req, candidate_requirements),
+            total_req + candidate_requirements,
+            species_mask | self._species_bit[candidates],
+            species_production + self._species_production[candidates],
+        )
+
+    def _group_aggregates(
+        self, idx: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Sum up the per-plant quantities the group score depends on, one row per group."""
+        # Sum up all nutrient coefficients
+        coef = self._coef[idx]
+        totals = coef.sum(axis=1)
+
+        # Calculate per-plant requirements: each plant needs 2*radius of each nutrient
+        plant_requirements = 2 * self._radii[idx]
+        max_requirement_per_plant = plant_requirements.max(axis=1, initial=0.0)
+        total_requirement_all_plants = plant_requirements.sum(axis=1)
+
+        # Species present as a bitmask, and own-nutrient production summed per species
+        species_mask = np.bitwise_or.reduce(self._species_bit[idx], axis=1)
+        species_production = self._species_production[idx].sum(axis=1)
+
+        return (
+            totals,
+            max_requirement_per_plant,
+            total_requirement_all_plants,
+            species_mask,
+            species_production,
+        )
+
+    def _score_aggregates(
+        self,
+        totals: np.ndarray,
+        max_requirement_per_plant: np.ndarray,
+        total_requirement_all_plants: np.ndarray,
+        species_mask: np.ndarray,
+        species_production: np.ndarray,
+    ) -> np.ndarray:
         """
         Optimized evaluation based on project requirements.
 
@@ -80,91 +261,51 @@ class Gardener1Prev(Gardener):
         - Net production must be positive but balanced across nutrients
 
         Args:
-            group: List of plant varieties
+            totals: Summed nutrient coefficients per group
+            max_requirement_per_plant: Largest 2*radius in each group
+            total_requirement_all_plants: Sum of 2*radius over each group
+            species_mask: Bitmask of the species present in each group
+            species_production: Summed own-nutrient production per species in each group
 
         Returns:
-            Score representing group quality (higher is better)
+            Score per group representing group quality (higher is better)
         """
-        if not group:
-            return 0.0
-
-        # Sum up all nutrient coefficients
-        total_r = sum(v.nutrient_coefficients[Micronutrient.R] for v in group)
-        total_g = sum(v.nutrient_coefficients[Micronutrient.G] for v in group)
-        total_b = sum(v.nutrient_coefficients[Micronutrient.B] for v in group)
-
         # CRITICAL: Growth requires 2*radius of EACH nutrient PER PLANT
         # Each plant needs 2*radius of R, 2*radius of G, AND 2*radius of B
         # Production varies per nutrient (e.g., R=10, G=5, B=3), so we must check optimally
 
-        # Calculate per-plant requirements: each plant needs 2*radius of each nutrient
-        plant_requirements = [2 * v.radius for v in group]
-        max_requirement_per_plant = max(plant_requirements) if plant_requirements else 0
-        total_requirement_all_plants = sum(plant_requirements)
-
         # KEY INSIGHT: Each nutrient is independent - a plant needs ALL three to grow
-        # So we check if EACH nutrient can support EACH plant's requirement
-        # Since production varies (R might be high, B might be low), we need per-nutrient checks
-
-        # Check if each nutrient can support the most demanding plant
-        # This ensures at least one plant can potentially get all its nutrients
-        r_suff_per_plant = (
-            total_r / max_requirement_per_plant if max_requirement_per_plant > 0 else 0
-        )
-        g_suff_per_plant = (
-            total_g / max_requirement_per_plant if max_requirement_per_plant > 0 else 0
-        )
-        b_suff_per_plant = (
-            total_b / max_requirement_per_plant if max_requirement_per_plant > 0 else 0
-        )
-
-        # Check if each nutrient can support all plants growing simultaneously
-        # This ensures all plants can potentially get all their nutrients
-        r_suff_all = (
-            total_r / total_requirement_all_plants if total_requirement_all_plants > 0 else 0
-        )
-        g_suff_all = (
-            total_g / total_requirement_all_plants if total_requirement_all_plants > 0 else 0
-        )
-        b_suff_all = (
-            total_b / total_requirement_all_plants if total_requirement_all_plants > 0 else 0
-        )
-
         # CRITICAL: The bottleneck is the minimum across ALL nutrients
         # This is the limiting factor - if one nutrient is insufficient, plants can't grow
-        # We check both per-plant and total, taking the more conservative
-        min_per_plant_sufficiency = min(r_suff_per_plant, g_suff_per_plant, b_suff_per_plant)
-        min_total_sufficiency = min(r_suff_all, g_suff_all, b_suff_all)
+        # NOTE: Every nutrient is divided by the same requirement, so the scarcest nutrient
+        # gives the minimum sufficiency; radii are positive, so requirements are never zero
+        scarcest_total = totals.min(axis=1)
 
-        # Use the more conservative metric
+        # Check if each nutrient can support the most demanding plant (per-plant), and all plants
+        # growing simultaneously (total), taking the more conservative
         # This ensures: (1) each plant can get nutrients, AND (2) all can grow together
-        # The minimum across nutrients ensures balance across R, G, B
-        min_sufficiency = min(min_per_plant_sufficiency, min_total_sufficiency)
+        min_sufficiency = np.minimum(
+            scarcest_total / max_requirement_per_plant,
+            scarcest_total / total_requirement_all_plants,
+        )
 
         # Calculate net production per turn from the group
-        net_production = total_r + total_g + total_b
+        net_production = totals.sum(axis=1)
 
         # Balance score: reward balanced production
         # Penalize imbalance more heavily (variance from mean)
         mean_production = net_production / 3
-        variance = (
-            (total_r - mean_production) ** 2
-            + (total_g - mean_production) ** 2
-            + (total_b - mean_production) ** 2
-        ) / 3
-        balance_penalty = math.sqrt(variance)
+        variance = ((totals - mean_production[:, None]) ** 2).sum(axis=1) / 3
+        balance_penalty = np.sqrt(variance)
 
         # Base score: positive net production with balanced nutrients
         base_score = net_production - balance_penalty * self.params['balance_penalty_multiplier']
 
         # CRITICAL: Species diversity - MUST have all 3 species for exchanges
-        species_set = {v.species for v in group}
-        if len(species_set) == 3:
-            species_bonus = self.params['species_bonus_all']
-        elif len(species_set) == 2:
-            species_bonus = self.params['species_bonus_two']
-        else:
-            species_bonus = 0.0  # No exchanges possible
+        num_species = SPECIES_COUNT[species_mask]
+        species_bonus = np.array(
+            [0.0, 0.0, self.params['species_bonus_two'], self.params['species_bonus_all']]
+        )[num_species]
 
         # Growth efficiency: how well production matches growth needs
         # Reward groups where production can sustain continuous growth
@@ -172,34 +313,10 @@ class Gardener1Prev(Gardener):
 
         # Exchange potential: calculate how well plants can exchange
         # Ideal: Each plant pairs with complementary species
-        exchange_potential = 0.0
-        for i, v1 in enumerate(group):
-            for v2 in group[i + 1 :]:
-                if v1.species != v2.species:
-                    # Calculate exchange compatibility
-                    # One produces what the other needs
-                    # Manual species->nutrient mapping
-                    if v1.species == Species.RHODODENDRON:
-                        prod1 = Micronutrient.R
-                    elif v1.species == Species.GERANIUM:
-                        prod1 = Micronutrient.G
-                    else:  # BEGONIA
-                        prod1 = Micronutrient.B
-
-                    if v2.species == Species.RHODODENDRON:
-                        prod2 = Micronutrient.R
-                    elif v2.species == Species.GERANIUM:
-                        prod2 = Micronutrient.G
-                    else:
-                        prod2 = Micronutrient.B
-
-                    # Reward if they produce different nutrients (can exchange)
-                    if prod1 != prod2:
-                        # Calculate how much they can exchange
-                        # Based on production coefficients
-                        coef1 = v1.nutrient_coefficients[prod1]
-                        coef2 = v2.nutrient_coefficients[prod2]
-                        exchange_potential += coef1 * coef2  # Reward high production pairs
+        # Every cross-species pair adds the product of what each plant produces, so summing
+        # production per species turns the pairwise sum into products of three totals
+        r_prod, g_prod, b_prod = species_production.T
+        exchange_potential = r_prod * g_prod + r_prod * b_prod + g_prod * b_prod
 
         # Combined score prioritizing critical factors
         final_score = (
@@ -240,44 +357,45 @@ class Gardener1Prev(Gardener):
     def _greedy_grouping(self, k: int) -> list[list[PlantVariety]]:
         """Fast greedy grouping for large numbers of varieties."""
         groups = []
-        remaining = self.varieties.copy()
+        alive = np.ones(len(self.varieties), dtype=bool)
+        num_alive = len(self.varieties)
 
         # Group varieties by species for better diversity
-        species_groups = {Species.RHODODENDRON: [], Species.GERANIUM: [], Species.BEGONIA: []}
-        for v in remaining:
-            species_groups[v.species].append(v)
+        # NOTE: Entries used elsewhere stay queued and are skipped when they reach the front
+        species_groups = {species: deque() for species in Species}
+        for i, v in enumerate(self.varieties):
+            species_groups[v.species].append(i)
 
-        while remaining:
+        while num_alive:
             group = []
 
             # Try to ensure species diversity: take one from each species if available
             for species in [Species.RHODODENDRON, Species.GERANIUM, Species.BEGONIA]:
-                if species_groups[species] and len(group) < k:
-                    group.append(species_groups[species].pop(0))
-                    remaining.remove(group[-1])
+                queue = species_groups[species]
+                while queue and not alive[queue[0]]:
+                    queue.popleft()
+
+                if queue and len(group) < k:
+                    group.append(queue.popleft())
+                    alive[group[-1]] = False
+                    num_alive -= 1
 
             # Fill remaining slots with best matches
-            while len(group) < k and remaining:
-                best_v = None
-                best_score = float('-inf')
-
-                for v in remaining[: min(50, len(remaining))]:  # Limit search for speed
-                    test_group = group + [v]
-                    score = self._evaluate_group_balance(test_group)
-                    if score > best_score:
-                        best_score = score
-                        best_v = v
-
-                if best_v:
-                    group.append(best_v)
-                    remaining.remove(best_v)
-                    if best_v in species_groups[best_v.species]:
-                        species_groups[best_v.species].remove(best_v)
-                else:
-                    break
+            while len(group) < k and num_alive:
+                candidates = np.flatnonzero(alive)[:50].tolist()  # Limit search for speed
+
+                # Score every candidate extension of the group in one batch
+                scores = self._evaluate_extensions(group, candidates)
+                best = int(np.argmax(scores))
+                best_v = candidates[best]
+
+                group.append(best_v)
+                alive[best_v] = False
+                num_alive -= 1
+                self._group_scores[tuple(sorted(group))] = float(scores[best])
 
             if group:
-                groups.append(group)
+                groups.append([self.varieties[i] for i in group])
             else:
                 break
 
@@ -286,10 +404,10 @@ class Gardener1Prev(Gardener):
     def _limited_search_grouping(self, k: int) -> list[list[PlantVariety]]:
         """Limited combinatorial search for smaller sets."""
         groups = []
-        used = set()
+        used = np.zeros(len(self.varieties), dtype=bool)
 
-        while len(used) < len(self.varieties):
-            remaining = [v for i, v in enumerate(self.varieties) if i not in used]
+        while not used.all():
+            remaining = np.flatnonzero(~used).tolist()
 
             if not remaining:
                 break
@@ -299,54 +417,76 @@ class Gardener1Prev(Gardener):
             # Limit search space: only try combinations from first 30 remaining
             search_space = remaining[: min(30, len(remaining))]
 
-            best_score = float('-inf')
-            best_group = None
-
-            def find_group(
-                idx: int, count: int, current: list[int], space=search_space, size=group_size
-            ) -> None:
-                nonlocal best_score, best_group
-
-                if count == size:
-                    group = [space[i] for i in current]
-                    score = self._evaluate_group_balance(group)
-                    if score > best_score:
-                        best_score = score
-                        best_group = current[:]
-                    return
-
-                if idx >= len(space):
-                    return
-
-                # Take current
-                current.append(idx)
-                find_group(idx + 1, count + 1, current, space, size)
-                current.pop()
-
-                # Skip current
-                find_group(idx + 1, count, current, space, size)
-
-            find_group(0, 0, [])
+            if math.comb(len(search_space), group_size) <= EXHAUSTIVE_SEARCH_LIMIT:
+                best_group, best_score = self._exhaustive_search_group(search_space, group_size)
+            else:
+                best_group, best_score = self._beam_search_group(search_space, group_size)
 
             if best_group:
-                group = [search_space[i] for i in best_group]
-                groups.append(group)
+                groups.append([self.varieties[i] for i in best_group])
+                self._group_scores[tuple(best_group)] = best_score
                 # Mark as used
-                for variety in group:
-                    for i, v in enumerate(self.varieties):
-                        if v is variety:
-                            used.add(i)
-                            break
+                used[best_group] = True
             else:
                 # Fallback: take first k remaining
                 if remaining:
-                    groups.append(remaining[:group_size])
+                    groups.append([self.varieties[i] for i in remaining[:group_size]])
                 break
 
         return groups
 
+    def _exhaustive_search_group(
+        self, search_space: list[int], size: int
+    ) -> tuple[list[int] | None, float]:
+        """Best group of the given size among all combinations of the search space."""
+        space = np.array(search_space, dtype=np.int64)
+        best_score = float('-inf')
+        best_group = None
+
+        # Score combinations in batches, in the same order as a take-before-skip recursion
+        combinations = itertools.combinations(range(len(space)), size)
+        while True:
+            batch = itertools.chain.from_iterable(itertools.islice(combinations, COMBINATION_BATCH))
+            current = np.fromiter(batch, dtype=np.int64).reshape(-1, size)
+            if not len(current):
+                break
+
+            scores = self._evaluate_groups(space[current])
+            best = int(np.argmax(scores))
+            if scores[best] > best_score:
+                best_score = float(scores[best])
+                best_group = space[current[best]].tolist()
+
+        return best_group, best_score
+
+    def _beam_search_group(
+        self, search_space: list[int], size: int
+    ) -> tuple[list[int] | None, float]:
+        """Best group found by growing the BEAM_WIDTH best partial groups one plant at a time."""
+        beam: list[list[int]] = [[]]
+        best_score = float('-inf')
+
+        for _ in range(size):
+            extended: dict[tuple[int, ...], float] = {}
+            for group in beam:
+                candidates = [i for i in search_space if i not in group]
+                scores = self._evaluate_extensions(group, candidates)
+                for i, score in zip(candidates, scores.tolist(), strict=True):
+                    # NOTE: The same set reached in another order is kept once
+                    extended.setdefault(tuple(sorted(group + [i])), score)
+
+            ranked = sorted(extended.items(), key=lambda item: item[1], reverse=True)
+            beam = [list(group) for group, _ in ranked[:BEAM_WIDTH]]
+            best_score = ranked[0][1]
+
+        return (beam[0] if beam[0] else None), best_score
+
     def _place_group_on_grid(
-        self, group: list[PlantVariety], grid_positions: list[Position], test_garden: Garden
+        self,
+        group: list[PlantVariety],
+        grid_xy: np.ndarray,
+        test_garden: Garden,
+        placeable: dict[float, np.ndarray] | None = None,
     ) -> list[tuple[PlantVariety, Position]]:
         """
         Enhanced placement strategy that maximizes exchange opportunities.
@@ -359,138 +499,235 @@ class Gardener1Prev(Gardener):
 
         Args:
             group: List of plant varieties to place
-            grid_positions: Available grid positions
+            grid_xy: Available grid positions as an (N, 2) array
             test_garden: Garden instance for testing placement
+            placeable: Placeable masks over grid_xy keyed by radius, updated in place as plants
+                are added; built from test_garden when omitted
 
         Returns:
             List of (variety, position) tuples for successful placements
         """
         placements = []
+        if placeable is None:
+            placeable = self._placeable_masks({v.radius for v in group}, grid_xy, test_garden)
 
         # Sort plants by radius (larger first) for better packing and growth potential
         # Also prioritize by production coefficient (more productive first)
-        sorted_group = sorted(
-            group,
-            key=lambda v: (
-                v.radius,  # Primary: larger radius = more growth
-                max(v.nutrient_coefficients.values()),  # Secondary: higher production
-            ),
-            reverse=True,
-        )
+        # NOTE: lexsort is stable like sorted(reverse=True), so ties keep their group order
+        group_idx = np.array([self._variety_index[id(v)] for v in group], dtype=np.int64)
+        order = np.lexsort((-self._max_coef[group_idx], -self._radii[group_idx]))
+
+        # NOTE: Running arrays of this group's placed plants, filled in placement order
+        placed_xy = np.empty((len(group), 2), dtype=np.float64)
+        placed_idx = np.empty(len(group), dtype=np.int64)
+
+        for variety_idx in group_idx[order].tolist():
+            variety = self.varieties[variety_idx]
+            # Try every grid position the plant fits at
+            open_idx = np.flatnonzero(placeable[variety.radius])
+            if not len(open_idx):
+                continue
 
-        for variety in sorted_group:
-            best_position = None
-            best_score = -1
-            packing_score = -1  # Track best packing-only score as fallback
-
-            # Try each grid position
-            for pos in grid_positions:
-                if test_garden.can_place_plant(variety, pos):
-                    score = 0.0
-                    packing_only_score = 0.0
-                    interaction_count = 0
-                    cross_species_count = 0
-                    optimal_distance_bonus = 0.0
-                    min_distance_bonus = 0.0  # Bonus for tight packing
-
-                    # Evaluate interactions with already placed plants
-                    for placed_variety, placed_pos in placements:
-                        distance = math.sqrt(
-                            (pos.x - placed_pos.x) ** 2 + (pos.y - placed_pos.y) ** 2
-                        )
-                        min_required_distance = max(variety.radius, placed_variety.radius)
-                        interaction_distance = variety.radius + placed_variety.radius
-
-                        # PACKING OPTIMIZATION: Bonus for perfect packing (exact minimum distance)
-                        # This maximizes garden capacity with 100% packing efficiency
-                        if distance >= min_required_distance:
-                            # Bonus only for exact minimum distance (perfect packing)
-                            distance_ratio = (
-                                distance / min_required_distance if min_required_distance > 0 else 0
-                            )
-                            # Only reward exact minimum (1.0) for perfect packing
-                            if (
-                                abs(distance_ratio - 1.0) < 0.01
-                            ):  # Exactly at minimum (with small tolerance for floating point)
-                                min_distance_bonus += 3.0  # Maximum bonus for perfect packing
-                            packing_only_score += min_distance_bonus
-
-                        # Check if within interaction range for exchanges
-                        # Also check positions just outside that are very close to boundary
-                        optimal_ratio = (
-                            distance / interaction_distance if interaction_distance > 0 else 0
-                        )
-
-                        if distance < interaction_distance:
-                            interaction_count += 1
-
-                            # Cross-species interactions are more valuable
-                            if variety.species != placed_variety.species:
-                                cross_species_count += 1
-
-                                # CRITICAL: Optimal distance for exchanges
-                                # Place at maximum interaction distance (ratio ≈ 1.0)
-                                # Reward positions closest to interaction boundary for maximum distance
-                                if (
-                                    optimal_ratio >= 0.99
-                                ):  # Very close to maximum (99%+ of interaction distance)
-                                    optimal_distance_bonus += (
-                                        3.0  # Perfect positioning for exchanges
-                                    )
-
-                                # Bonus for complementary exchanges
-                                nutrient1 = variety.nutrient_coefficients
-                                nutrient2 = placed_variety.nutrient_coefficients
-
-                                # Reward if one produces what the other needs
-                                for nut in Micronutrient:
-                                    if (nutrient1[nut] > 0 and nutrient2[nut] < 0) or (
-                                        nutrient1[nut] < 0 and nutrient2[nut] > 0
-                                    ):
-                                        optimal_distance_bonus += 1.0
-
-                    # Score calculation: balance packing density with exchanges
-                    # KEY INSIGHT: For large gardens, packing first is critical
-                    partner_penalty = (
-                        max(
-                            0, (cross_species_count - 3) * self.params['partner_penalty_multiplier']
-                        )
-                        if cross_species_count > 3
-                        else 0
-                    )
-
-                    # Combined score: prioritize exchanges when possible, but also reward packing
-                    score = (
-                        cross_species_count * self.params['cross_species_weight']
-                        + optimal_distance_bonus * self.params['optimal_distance_weight']
-                        + min_distance_bonus * self.params['min_distance_weight']
-                        + (variety.radius * self.params['radius_weight'])
-                        - partner_penalty  # Penalty for too many partners
-                    )
-
-                    # Packing-only score (for when no exchanges available)
-                    packing_only_score = min_distance_bonus + interaction_count * 0.5
-
-                    # Always consider both scores, but prioritize exchanges when available
-                    if cross_species_count > 0:
-                        # We have exchanges - use combined score
-                        if score > best_score:
-                            best_score = score
-                            best_position = pos
-                    else:
-                        # No exchanges - prioritize tight packing
-                        if packing_only_score > packing_score:
-                            packing_score = packing_only_score
-                            best_position = pos
-                            best_score = packing_only_score  # Use packing score as main score
-
-            if best_position:
+            # NOTE: With nothing placed yet every position is packing-only with a zero packing
+            # score, so no later position can beat the first one and scoring is skipped
+            num_placed = len(placements)
+            if num_placed:
+                score, packing_only_score, cross_species_count = self._score_positions(
+                    variety_idx,
+                    grid_xy[open_idx],
+                    placed_xy[:num_placed],
+                    placed_idx[:num_placed],
+                )
+                best = self._select_position(score, packing_only_score, cross_species_count > 0)
+                if best is None:
+                    continue
+            else:
+                best = 0
+
+            # Simulate placement in test garden
+            best_position = Position(*grid_xy[open_idx[best]].tolist())
+            if test_garden.add_plant(variety, best_position) is not None:
+                placed_xy[num_placed] = grid_xy[open_idx[best]]
+                placed_idx[num_placed] = variety_idx
                 placements.append((variety, best_position))
-                # Simulate placement in test garden
-                test_garden.add_plant(variety, best_position)
+
+                # Positions too close to the new plant are no longer placeable for any radius
+                dx = grid_xy[:, 0] - best_position.x
+                dy = grid_xy[:, 1] - best_position.y
+                for radius, mask in placeable.items():
+                    mask &= ~within_distance(dx, dy, max(radius, variety.radius))
 
         return placements
 
+    def _placeable_masks(
+        self, radii: Iterable[float], grid_xy: np.ndarray, test_garden: Garden
+    ) -> dict[float, np.ndarray]:
+        """Mask of grid positions that are in bounds and clear of every plant, per radius."""
+        x, y = grid_xy[:, 0], grid_xy[:, 1]
+        in_bounds = (x >= 0) & (x <= test_garden.width) & (y >= 0) & (y <= test_garden.height)
+
+        table = test_garden.table
+        if len(table):
+            dx = x[:, None] - table.position[:, 0]
+            dy = y[:, None] - table.position[:, 1]
+
+        masks = {}
+        for radius in radii:
+            masks[radius] = in_bounds.copy()
+            if len(table):
+                min_distance = np.maximum(radius, table.radius)
+                masks[radius] &= ~within_distance(dx, dy, min_distance).any(axis=1)
+
+        return masks
+
+    def _score_positions(
+        self,
+        variety_idx: int,
+        xy: np.ndarray,
+        placed_xy: np.ndarray,
+        placed_idx: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Score every candidate position against the plants already placed from this group."""
+        radius = self._radii[variety_idx]
+        placed_radius = self._radii[placed_idx]
+        is_cross_species = self._produced[placed_idx] != self._produced[variety_idx]
+
+        # Reward if one produces what the other needs
+        complementary = (
+            np.sign(self._coef[placed_idx]) * np.sign(self._coef[variety_idx]) < 0
+        ).sum(axis=1, dtype=np.float64)
+
+        if HAS_NUMBA:
+            return _score_positions_kernel(
+                xy,
+                placed_xy,
+                placed_radius,
+                is_cross_species,
+                complementary,
+                radius,
+                self.params['cross_species_weight'],
+                self.params['optimal_distance_weight'],
+                self.params['min_distance_weight'],
+                self.params['radius_weight'],
+                self.params['partner_penalty_multiplier'],
+            )
+
+        num_positions = len(xy)
+        min_distance_bonus = np.zeros(num_positions)  # Bonus for tight packing
+        optimal_distance_bonus = np.zeros(num_positions)
+        interaction_count = np.zeros(num_positions, dtype=np.int64)
+        cross_species_count = np.zeros(num_positions, dtype=np.int64)
+
+        # Evaluate interactions with already placed plants
+        if len(placed_idx):
+            distance, delta, mask, crossing = self._scoring_scratch(num_positions, len(placed_idx))
+            np.subtract(xy[:, 0, None], placed_xy[:, 0], out=delta)
+            np.multiply(delta, delta, out=distance)
+            np.subtract(xy[:, 1, None], placed_xy[:, 1], out=delta)
+            delta *= delta
+            distance += delta
+            np.sqrt(distance, out=distance)
+            min_required_distance = np.maximum(radius, placed_radius)
+            interaction_distance = radius + placed_radius
+
+            # PACKING OPTIMIZATION: Bonus for perfect packing (exact minimum distance)
+            # Only reward exact minimum (1.0), with small tolerance for floating point
+            np.divide(distance, min_required_distance, out=delta)
+            delta -= 1.0
+            np.abs(delta, out=delta)
+            np.greater_equal(distance, min_required_distance, out=mask)
+            mask &= np.less(delta, PERFECT_PACKING_TOLERANCE, out=crossing)
+            min_distance_bonus = 3.0 * mask.sum(axis=1)
+
+            # Check if within interaction range for exchanges, by the garden's own rule
+            np.less(distance, interaction_distance, out=mask)
+            interaction_count = mask.sum(axis=1)
+
+            # Cross-species interactions are more valuable
+            np.logical_and(mask, is_cross_species, out=crossing)
+            cross_species_count = crossing.sum(axis=1)
+
+            # CRITICAL: Optimal distance for exchanges
+            # Reward positions at 99%+ of the interaction distance, plus complementary exchanges
+            np.divide(distance, interaction_distance, out=delta)
+            np.greater_equal(delta, OPTIMAL_EXCHANGE_RATIO, out=mask)
+            np.multiply(mask, 3.0, out=delta)
+            delta += complementary
+            delta *= crossing
+            optimal_distance_bonus = delta.sum(axis=1)
+
+        # Score calculation: balance packing density with exchanges
+        # KEY INSIGHT: For large gardens, packing first is critical
+        partner_penalty = np.where(
+            cross_species_count > 3,
+            (cross_species_count - 3) * self.params['partner_penalty_multiplier'],
+            0,
+        )
+
+        # Combined score: prioritize exchanges when possible, but also reward packing
+        score = (
+            cross_species_count * self.params['cross_species_weight']
+            + optimal_distance_bonus * self.params['optimal_distance_weight']
+            + min_distance_bonus * self.params['min_distance_weight']
+            + (radius * self.params['radius_weight'])
+            - partner_penalty  # Penalty for too many partners
+        )
+
+        # Packing-only score (for when no exchanges available)
+        packing_only_score = min_distance_bonus + interaction_count * 0.5
+
+        return score, packing_only_score, cross_species_count
+
+    def _scoring_scratch(
+        self, rows: int, cols: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Views into the reusable position-scoring buffers, grown when a call needs more room."""
+        buffer_rows, buffer_cols = self._distance_buffer.shape[1:]
+        if rows > buffer_rows or cols > buffer_cols:
+            shape = (max(rows, buffer_rows), max(cols, buffer_cols))
+            self._distance_buffer = np.empty((2, *shape), dtype=np.float64)
+            self._mask_buffer = np.empty((2, *shape), dtype=bool)
+
+        return (
+            self._distance_buffer[0, :rows, :cols],
+            self._distance_buffer[1, :rows, :cols],
+            self._mask_buffer[0, :rows, :cols],
+            self._mask_buffer[1, :rows, :cols],
+        )
+
+    def _select_position(
+        self, score: np.ndarray, packing_only_score: np.ndarray, has_exchanges: np.ndarray
+    ) -> int | None:
+        """
+        Pick the position a scan over the candidates in order would settle on.
+
+        Positions with exchanges win on a higher score than the current best, others on a
+        higher packing score than any earlier packing-only position, which then also becomes
+        the score to beat.
+        """
+        # Packing-only positions that beat every earlier one (the scan starts from -1)
+        packing = np.where(has_exchanges, -np.inf, packing_only_score)
+        earlier_best = np.maximum.accumulate(np.concatenate(([-1.0], packing[:-1])))
+        packing_records = np.flatnonzero(~has_exchanges & (packing_only_score > earlier_best))
+
+        # Only exchange positions after the last packing record can still replace it
+        if len(packing_records):
+            best = int(packing_records[-1])
+            best_score = packing_only_score[best]
+            start = best + 1
+        else:
+            best = None
+            best_score = -1
+            start = 0
+
+        exchange_score = np.where(has_exchanges[start:], score[start:], -np.inf)
+        if len(exchange_score):
+            candidate = int(np.argmax(exchange_score))
+            if exchange_score[candidate] > best_score:
+                best = start + candidate
+
+        return best
+
     def cultivate_garden(self) -> None:
         """
         Enhanced cultivation strategy that maximizes growth.
@@ -513,21 +750,10 @@ class Gardener1Prev(Gardener):
             grid_spacing = 1.0
 
         # Generate primary grid
-        grid_positions = self._generate_polygonal_grid(grid_spacing)
+        grid_xy = self._generate_polygonal_grid(grid_spacing)
 
-        # For mixed radii, add a finer secondary grid for small plants
-        if self.varieties:
-            min_radius = min(v.radius for v in self.varieties)
-            max_radius = max(v.radius for v in self.varieties)
-            if min_radius < max_radius and min_radius == 1:
-                # Add finer grid for radius 1 plants when mixed with larger ones
-                # Use exact minimum for perfect packing
-                fine_grid = self._generate_polygonal_grid(1.0)
-                # Combine grids (remove duplicates)
-                existing_positions = {(p.x, p.y) for p in grid_positions}
-                for pos in fine_grid:
-                    if (pos.x, pos.y) not in existing_positions:
-                        grid_positions.append(pos)
+        # NOTE: No finer secondary grid is merged in for radius 1 plants, the grid is spaced
+        # at the minimum radius and so already is that grid whenever radius 1 plants exist
 
         # Try multiple group sizes and select the best configuration
         # Group sizes to try: 3 (all species), 4-6 (more exchanges), and larger if needed
@@ -557,12 +783,12 @@ class Gardener1Prev(Gardener):
             total_score = sum(self._evaluate_group_balance(group) for group in groups)
 
             # Bonus for having all 3 species represented across groups
-            all_species = set()
+            all_species = 0
             for group in groups:
                 for v in group:
-                    all_species.add(v.species)
+                    all_species |= self._species_bit[self._variety_index[id(v)]]
 
-            if len(all_species) == 3:
+            if all_species == ALL_SPECIES:
                 total_score += 10.0  # Bonus for having all species
 
             # Prefer configurations that use more plants (less waste)
@@ -580,6 +806,21 @@ class Gardener1Prev(Gardener):
                 self._find_optimal_groups_dp(3) if len(self.varieties) >= 3 else [self.varieties]
             )
 
+        # NOTE: Placeable masks are built once for every radius and kept up to date as plants
+        # are added, instead of rechecking the whole garden for each plant
+        placeable = self._placeable_masks({v.radius for v in self.varieties}, grid_xy, self.garden)
+
         # Place each group
         for group in best_groups:
-            self._place_group_on_grid(group, grid_positions, self.garden)
+            placements = self._place_group_on_grid(group, grid_xy, self.garden, placeable)
+
+            # NOTE: Any plant needs at least a placed plant's radius of clearance from it, so
+            # positions closer than that can never be used again
+            open_positions = np.ones(len(grid_xy), dtype=bool)
+            for placed_variety, placed_pos in placements:
+                dx = grid_xy[:, 0] - placed_pos.x
+                dy = grid_xy[:, 1] - placed_pos.y
+                open_positions &= ~within_distance(dx, dy, placed_variety.radius)
+
+            grid_xy = grid_xy[open_positions]
+            placeable = {radius: mask[open_positions] for radius, mask in placeable.items()}
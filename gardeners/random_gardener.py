@@ -11,9 +11,12 @@ class RandomGardener(Gardener):
         super().__init__(garden, varieties)
 
     def cultivate_garden(self) -> None:
+        uniform = random.uniform
+        width, height = self.garden.width, self.garden.height
+
         for variety in self.varieties:
-            x = random.uniform(0, self.garden.width)
-            y = random.uniform(0, self.garden.height)
+            x = uniform(0, width)
+            y = uniform(0, height)
 
             position = Position(x, y)
 
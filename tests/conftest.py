@@ -0,0 +1,33 @@
+import os
+
+import pytest
+
+from core import kernels
+
+KERNELS = (
+    'produce',
+    'exchange_nutrients',
+    'grow',
+    'round_cents',
+    'calculate_offers',
+    'run_turn',
+)
+
+
+@pytest.fixture(params=[False, True], ids=['python', 'numba'])
+def compiled_kernels(request, monkeypatch):
+    """Run core.kernels compiled or as plain Python, with engine dispatch kept on NumPy."""
+    compiled = request.param
+    if compiled and not kernels.HAS_NUMBA:
+        # NOTE: CI installs the dev group, so the compiled variant must not be skipped there
+        if os.environ.get('CI'):
+            pytest.fail('numba is not installed')
+        pytest.skip('numba is not installed')
+
+    if not compiled and kernels.HAS_NUMBA:
+        for name in KERNELS:
+            monkeypatch.setattr(kernels, name, getattr(kernels, name).py_func)
+
+    # NOTE: Callers reach the kernels directly, the NumPy phases serve as the reference
+    monkeypatch.setattr(kernels, 'HAS_NUMBA', False)
+    return compiled
@@ -0,0 +1,88 @@
+from dataclasses import replace
+
+import numpy as np
+
+from core.engine import Engine
+from core.garden import Garden
+from core.point import Position
+from tests.engine.setup_engine import TestEngine
+
+
+class TestEngineKernel(TestEngine):
+    def _populate(self, garden: Garden) -> None:
+        garden.add_plant(self.rhodo_variety, Position(5, 5))
+        garden.add_plant(self.geranium_variety, Position(7, 5))
+        garden.add_plant(self.begonia_variety, Position(10, 5))
+
+    def test_compiled_turn_matches_phased_turn(self, compiled_kernels):
+        self._populate(self.garden)
+        phased = Engine(self.garden)
+
+        compiled_garden = Garden(width=16, height=10)
+        self._populate(compiled_garden)
+        compiled = Engine(compiled_garden)
+
+        for _ in range(20):
+            phased._daytime_production()
+            phased._evening_exchange()
+            phased_growth = phased._overnight_growth()
+
+            compiled_growth = compiled._compiled_turn()
+
+            assert compiled_growth == phased_growth
+            np.testing.assert_array_equal(
+                compiled_garden.table.inventory, self.garden.table.inventory
+            )
+            np.testing.assert_array_equal(compiled_garden.table.size, self.garden.table.size)
+
+    def test_compiled_turn_matches_phased_turn_on_dense_garden(self, compiled_kernels):
+        varieties = [self.rhodo_variety, self.geranium_variety, self.begonia_variety]
+        gardens = [self.garden, Garden(width=16, height=10)]
+        for garden in gardens:
+            for i, x in enumerate(np.arange(1.0, 15.0, 1.5)):
+                for j, y in enumerate(np.arange(1.0, 9.0, 1.5)):
+                    garden.add_plant(
+                        replace(varieties[(i + j) % 3], radius=1), Position(float(x), float(y))
+                    )
+
+            # NOTE: Inventories on a 0.005 grid put many offers on .5 rounding ties
+            rng = np.random.default_rng(7)
+            garden.table.inventory[:] = np.minimum(
+                rng.integers(0, 2000, size=garden.table.inventory.shape) * 0.005,
+                garden.table.reservoir[:, None],
+            )
+
+        phased = Engine(gardens[0])
+        compiled = Engine(gardens[1])
+
+        for _ in range(50):
+            phased._daytime_production()
+            phased._evening_exchange()
+            phased_growth = phased._overnight_growth()
+
+            compiled_growth = compiled._compiled_turn()
+
+            assert compiled_growth == phased_growth
+            np.testing.assert_array_equal(gardens[1].table.inventory, gardens[0].table.inventory)
+            np.testing.assert_array_equal(gardens[1].table.size, gardens[0].table.size)
+
+        assert gardens[0].total_growth() > 0
+
+    def test_run_turn_matches_phased_turn(self):
+        # NOTE: No fixture, run_turn takes the same path as in a simulation
+        self._populate(self.garden)
+        phased = Engine(self.garden)
+
+        dispatched_garden = Garden(width=16, height=10)
+        self._populate(dispatched_garden)
+        dispatched = Engine(dispatched_garden)
+
+        for _ in range(20):
+            phased._daytime_production()
+            phased._evening_exchange()
+            phased_growth = phased._overnight_growth()
+
+            assert dispatched.run_turn() == phased_growth
+            np.testing.assert_array_equal(
+                dispatched_garden.table.inventory, self.garden.table.inventory
+            )
@@ -73,3 +73,44 @@ class TestEngineMultipleTurns(TestEngine):
         # Should complete without error
         assert len(history) == 10
         assert all(growth == 0.0 for growth in history)
+
+    def test_repeated_simulations_extend_history(self):
+        self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+        self.garden.add_plant(self.geranium_variety, Position(7, 5))
+
+        engine = Engine(self.garden)
+        engine.run_simulation(turns=3)
+        engine.run_turn()
+        history = engine.run_simulation(turns=4)
+
+        assert engine.turn == 8
+        assert len(history) == 8
+        assert history[-1] == self.garden.total_growth()
+
+    def test_returned_history_is_not_updated_by_later_turns(self):
+        self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+        self.garden.add_plant(self.geranium_variety, Position(7, 5))
+
+        engine = Engine(self.garden)
+        history = engine.run_simulation(turns=3)
+        snapshot = list(history)
+        engine.run_simulation(turns=50)
+
+        assert isinstance(history, list)
+        assert history == snapshot
+        assert engine.growth_history[:3] == snapshot
+
+    def test_growth_history_is_cached_until_the_next_turn(self):
+        self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+
+        engine = Engine(self.garden)
+        engine.run_simulation(turns=3)
+        history = engine.growth_history
+
+        assert engine.growth_history is history
+
+        engine.run_turn()
+
+        assert engine.growth_history is not history
+        assert engine.growth_history[:3] == history
+        assert len(engine.growth_history) == 4
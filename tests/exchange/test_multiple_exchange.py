@@ -1,3 +1,8 @@
+from dataclasses import replace
+
+import numpy as np
+
+from core import kernels
 from core.micronutrients import Micronutrient
 from core.point import Position
 from tests.exchange.setup_exchange import TestNutrientExchange
@@ -70,3 +75,88 @@ class TestMultipleExchanges(TestNutrientExchange):
         # So minimum is 2.0 for both exchanges
         expected_r_remaining = initial_r - 2.0 - 2.0
         assert plant1.micronutrient_inventory[Micronutrient.R] == expected_r_remaining
+
+    def test_receiving_from_two_partners_respects_capacity(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+        plant2 = self.garden.add_plant(self.geranium_variety, Position(7, 5))
+        plant3 = self.garden.add_plant(self.begonia_variety, Position(5, 9))
+
+        plant1.micronutrient_inventory = {
+            Micronutrient.R: 20.0,  # Offers 5.0 total, 2.5 per partner
+            Micronutrient.G: 19.5,
+            Micronutrient.B: 19.5,
+        }
+        plant2.micronutrient_inventory = {
+            Micronutrient.R: 1.0,
+            Micronutrient.G: 10.0,  # Offers 2.5
+            Micronutrient.B: 1.0,
+        }
+        plant3.micronutrient_inventory = {
+            Micronutrient.R: 1.0,
+            Micronutrient.G: 1.0,
+            Micronutrient.B: 20.0,  # Offers 5.0
+        }
+
+        self.exchange.execute()
+
+        # Both exchanges move 2.5 and the rhododendron's G and B are capped at 20
+        assert plant1.micronutrient_inventory == {
+            Micronutrient.R: 15.0,
+            Micronutrient.G: 20.0,
+            Micronutrient.B: 20.0,
+        }
+        assert plant2.micronutrient_inventory[Micronutrient.R] == 3.5
+        assert plant2.micronutrient_inventory[Micronutrient.G] == 7.5
+        assert plant3.micronutrient_inventory[Micronutrient.R] == 3.5
+        assert plant3.micronutrient_inventory[Micronutrient.B] == 17.5
+
+    def test_exchange_kernel_matches_vectorized_exchange(self, compiled_kernels):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+        plant2 = self.garden.add_plant(self.geranium_variety, Position(7, 5))
+        plant3 = self.garden.add_plant(self.begonia_variety, Position(5, 9))
+
+        plant1.micronutrient_inventory[Micronutrient.R] = 16.0
+        plant2.micronutrient_inventory[Micronutrient.G] = 16.0
+        plant3.micronutrient_inventory[Micronutrient.B] = 16.0
+
+        table = self.garden.table
+        pair_i, pair_j = self.garden.interaction_index()
+        inventory = table.inventory.copy()
+        offers = self.exchange._calculate_offers().copy()
+
+        kernels.exchange_nutrients(
+            inventory, table.reservoir, table.produced_idx, offers, pair_i, pair_j
+        )
+        self.exchange.execute()
+
+        np.testing.assert_array_equal(inventory, table.inventory)
+
+    def test_exchange_kernel_matches_vectorized_exchange_on_dense_garden(self, compiled_kernels):
+        varieties = [self.rhodo_variety, self.geranium_variety, self.begonia_variety]
+        for i, x in enumerate(np.arange(1.0, 15.0, 1.5)):
+            for j, y in enumerate(np.arange(1.0, 9.0, 1.5)):
+                # NOTE: Each variety instance can only be planted once, radius 1 packs them
+                # tightly enough for most plants to have several partners
+                variety = replace(varieties[(i + j) % 3], radius=1)
+                self.garden.add_plant(variety, Position(float(x), float(y)))
+
+        # NOTE: Inventories on a 0.005 grid put many offers on .5 rounding ties, and plants
+        # with several partners give and receive in interleaved order
+        rng = np.random.default_rng(7)
+        table = self.garden.table
+        table.inventory[:] = np.minimum(
+            rng.integers(0, 6000, size=table.inventory.shape) * 0.005, table.reservoir[:, None]
+        )
+        pair_i, pair_j = self.garden.interaction_index()
+        assert np.bincount(np.concatenate((pair_i, pair_j))).max() > 2
+
+        for _ in range(5):
+            inventory = table.inventory.copy()
+            offers = self.exchange._calculate_offers().copy()
+
+            kernels.exchange_nutrients(
+                inventory, table.reservoir, table.produced_idx, offers, pair_i, pair_j
+            )
+            self.exchange.execute()
+
+            np.testing.assert_array_equal(inventory, table.inventory)
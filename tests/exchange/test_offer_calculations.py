@@ -1,3 +1,8 @@
+from dataclasses import replace
+
+import numpy as np
+
+from core import kernels
 from core.micronutrients import Micronutrient
 from core.point import Position
 from tests.exchange.setup_exchange import TestNutrientExchange
@@ -40,3 +45,47 @@ class TestOfferCalculations(TestNutrientExchange):
 
         offer = self.exchange._calculate_offer_to_partner(plant1)
         assert offer == 0.0
+
+    def test_offers_array_matches_per_plant_offers(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+        plant2 = self.garden.add_plant(self.geranium_variety, Position(7, 5))
+        plant3 = self.garden.add_plant(self.begonia_variety, Position(6, 8))
+
+        plant1.micronutrient_inventory[Micronutrient.R] = 10.13
+        plant2.micronutrient_inventory[Micronutrient.G] = 10.02
+
+        offers = self.exchange._calculate_offers()
+
+        for plant in (plant1, plant2, plant3):
+            assert offers[plant._idx] == self.exchange._calculate_offer_to_partner(plant)
+
+    def test_kernel_offers_match_vectorized_offers(self, compiled_kernels):
+        varieties = [self.rhodo_variety, self.geranium_variety, self.begonia_variety]
+        for i, x in enumerate(np.arange(1.0, 15.0, 1.5)):
+            # NOTE: Radius 1 copies pack closely enough for plants to share partners
+            self.garden.add_plant(replace(varieties[i % 3], radius=1), Position(float(x), 5.0))
+
+        # NOTE: Produced amounts on a 0.02 grid put every quarter on a .5 tie of the cents
+        table = self.garden.table
+        table.inventory[:] = np.arange(table.inventory.size).reshape(-1, 3) * 0.02 + 14.5
+
+        assert self.garden.partner_counts().max() == 2
+
+        offers = kernels.calculate_offers(
+            table.inventory, table.produced_idx, self.garden.partner_counts()
+        )
+
+        np.testing.assert_array_equal(offers, self.exchange._calculate_offers())
+
+    def test_kernel_rounds_cents_like_python(self, compiled_kernels):
+        amounts = np.concatenate(
+            (
+                np.arange(20000) * 0.005,
+                np.arange(20000) * 0.0025,
+                np.random.default_rng(3).random(10000) * 1000,
+            )
+        )
+
+        rounded = [kernels.round_cents(amount) for amount in amounts.tolist()]
+
+        assert rounded == [round(amount, 2) for amount in amounts.tolist()]
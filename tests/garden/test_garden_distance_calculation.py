@@ -1,5 +1,8 @@
 import math
 
+import numpy as np
+
+from core.garden import within_distance
 from core.point import Position
 from tests.garden.garden_setup import TestGarden
 
@@ -35,3 +38,15 @@ class TestGardenDistanceCalculation(TestGarden):
 
         expected = math.sqrt((3.0) ** 2 + (4.0) ** 2)
         assert self.garden._calculate_distance(pos1, pos2) == expected
+
+    def test_within_distance_matches_calculate_distance(self):
+        # Hex grid offsets whose squared distances round just below the squared threshold
+        dx = np.array([0.5, 1.0, 3.0, 0.0])
+        dy = np.array([math.sqrt(3) / 2, math.sqrt(3), 4.0, 1.99])
+        threshold = np.array([1.0, 2.0, 5.0, 2.0])
+
+        expected = [
+            self.garden._calculate_distance(Position(x, y), Position(0, 0)) < t
+            for x, y, t in zip(dx.tolist(), dy.tolist(), threshold.tolist(), strict=True)
+        ]
+        assert within_distance(dx, dy, threshold).tolist() == expected
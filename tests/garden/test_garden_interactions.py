@@ -1,4 +1,5 @@
 from core.micronutrients import Micronutrient
+from core.plants.plant import Plant
 from core.plants.plant_variety import PlantVariety
 from core.plants.species import Species
 from core.point import Position
@@ -144,3 +145,20 @@ class TestGardenInteractions(TestGarden):
 
         interaction_ids = [frozenset([id(p1), id(p2)]) for p1, p2 in interactions]
         assert len(interaction_ids) == len(set(interaction_ids))
+
+    def test_get_all_interactions_updates_after_new_plant(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+        assert self.garden.get_all_interactions() == []
+
+        plant2 = self.garden.add_plant(self.geranium_variety, Position(7, 5))
+        assert self.garden.get_all_interactions() == [(plant1, plant2)]
+
+        self.garden.plants.remove(plant2)
+        assert self.garden.get_all_interactions() == []
+
+    def test_get_interacting_plants_for_plant_outside_garden(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+        outsider = Plant(variety=self.geranium_variety, position=Position(7, 5))
+
+        assert self.garden.get_interacting_plants(outsider) == [plant1]
+        assert self.garden.get_interacting_plants(plant1) == []
@@ -1,3 +1,5 @@
+import math
+
 from core.micronutrients import Micronutrient
 from core.plants.plant_variety import PlantVariety
 from core.plants.species import Species
@@ -50,6 +52,26 @@ class TestGardenPlantPlacement(TestGarden):
         assert plant2 is not None
         assert len(self.garden.plants) == 2
 
+    def test_add_plant_at_hex_grid_minimum_distance_succeeds(self):
+        other_geranium = PlantVariety(
+            name='Other Geranium',
+            radius=1,
+            species=Species.GERANIUM,
+            nutrient_coefficients={
+                Micronutrient.R: -0.5,
+                Micronutrient.G: 2.0,
+                Micronutrient.B: -0.5,
+            },
+        )
+
+        # Hex grid neighbours 1 apart, whose squared distance rounds just below 1
+        plant1 = self.garden.add_plant(self.geranium_variety, Position(0, 0))
+        plant2 = self.garden.add_plant(other_geranium, Position(0.5, math.sqrt(3) / 2))
+
+        assert plant1 is not None
+        assert plant2 is not None
+        assert len(self.garden.plants) == 2
+
     def test_add_plant_just_under_minimum_distance_fails(self):
         plant1 = self.garden.add_plant(self.rhodo_variety, Position(0, 0))
         # Rhodo radius = 2, so second rhodo needs distance >= 2
@@ -117,3 +139,32 @@ class TestGardenPlantPlacement(TestGarden):
         assert plant1 is not None
         assert plant2 is not None
         assert len(self.garden.plants) == 2
+
+    def test_large_radius_blocks_placement_across_cells(self):
+        wide_variety = PlantVariety(
+            name='Wide Begonia',
+            radius=7,
+            species=Species.BEGONIA,
+            nutrient_coefficients={
+                Micronutrient.R: -1.0,
+                Micronutrient.G: -1.0,
+                Micronutrient.B: 4.0,
+            },
+        )
+
+        plant1 = self.garden.add_plant(wide_variety, Position(1, 1))
+
+        # Far outside the neighbouring cells, but still within the wide plant's radius
+        plant2 = self.garden.add_plant(self.geranium_variety, Position(7, 1))
+
+        assert plant1 is not None
+        assert plant2 is None
+
+    def test_removed_plant_no_longer_blocks_placement(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+        self.garden.plants.remove(plant1)
+
+        plant2 = self.garden.add_plant(self.begonia_variety, Position(6, 5))
+
+        assert plant2 is not None
+        assert self.garden.plants == [plant2]
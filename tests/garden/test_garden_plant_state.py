@@ -0,0 +1,128 @@
+import copy
+
+from core.engine import Engine
+from core.micronutrients import Micronutrient
+from core.plants.plant import Plant
+from core.point import Position
+from tests.garden.garden_setup import TestGarden
+
+
+class TestGardenPlantState(TestGarden):
+    def test_plant_state_is_shared_with_garden(self):
+        plant = self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+
+        plant.size = 12.0
+        plant.micronutrient_inventory[Micronutrient.G] = 3.0
+
+        assert self.garden.total_growth() == 12.0
+        assert plant.micronutrient_inventory[Micronutrient.G] == 3.0
+
+    def test_removed_plant_is_dropped_from_total(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(2, 2))
+        plant2 = self.garden.add_plant(self.geranium_variety, Position(10, 2))
+
+        plant1.size = 10.0
+        plant2.size = 5.0
+
+        self.garden.plants.remove(plant1)
+
+        assert self.garden.total_growth() == 5.0
+        assert plant2.size == 5.0
+
+    def test_appended_plant_keeps_its_state(self):
+        plant = Plant(variety=self.begonia_variety, position=Position(8, 5))
+        plant.size = 7.0
+        plant.micronutrient_inventory[Micronutrient.B] = 1.5
+
+        self.garden.plants.append(plant)
+
+        assert self.garden.total_growth() == 7.0
+        assert plant.micronutrient_inventory[Micronutrient.B] == 1.5
+
+        plant.size = 9.0
+        assert self.garden.total_growth() == 9.0
+
+    def test_add_plant_after_external_edit(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(2, 2))
+        plant1.size = 4.0
+
+        self.garden.plants = []
+        self.garden._used_varieties = set()
+
+        plant2 = self.garden.add_plant(self.rhodo_variety, Position(2, 2))
+        plant2.size = 6.0
+
+        assert plant1.size == 4.0
+        assert self.garden.total_growth() == 6.0
+
+    def test_replaced_plant_is_picked_up(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(2, 2))
+        self.garden.add_plant(self.geranium_variety, Position(10, 2))
+        plant1.size = 4.0
+
+        plant3 = Plant(variety=self.begonia_variety, position=Position(2, 8))
+        plant3.size = 7.0
+        self.garden.plants[0] = plant3
+
+        assert self.garden.total_growth() == 7.0
+        assert self.garden.get_interacting_plants(plant3) == []
+
+    def test_add_plant_keeps_table(self):
+        self.garden.add_plant(self.rhodo_variety, Position(2, 2))
+        table = self.garden.table
+
+        self.garden.add_plant(self.geranium_variety, Position(10, 2))
+
+        assert self.garden.table is table
+        assert len(table) == 2
+
+    def test_produce_all_matches_plant_produce(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(2, 2))
+        plant2 = self.garden.add_plant(self.geranium_variety, Position(10, 2))
+        plant1.micronutrient_inventory[Micronutrient.G] = 0.5
+
+        expected = Plant(variety=self.geranium_variety, position=Position(0, 0))
+        expected.produce()
+
+        self.garden.produce_all()
+
+        # Rhododendron lacks G and must not produce
+        assert plant1.micronutrient_inventory == {
+            Micronutrient.R: 10.0,
+            Micronutrient.G: 0.5,
+            Micronutrient.B: 10.0,
+        }
+        assert plant2.micronutrient_inventory == expected.micronutrient_inventory
+
+    def test_grow_all_matches_plant_grow(self):
+        plant1 = self.garden.add_plant(self.rhodo_variety, Position(2, 2))
+        plant2 = self.garden.add_plant(self.geranium_variety, Position(10, 2))
+        plant1.micronutrient_inventory[Micronutrient.B] = 3.0
+        plant2.size = plant2.max_size - 1
+
+        growth = self.garden.grow_all()
+
+        # Rhododendron needs 2 * radius = 4 of each nutrient, Geranium has room for one more step
+        assert growth == 1.0
+        assert plant1.size == 0.0
+        assert plant2.size == plant2.max_size
+        assert plant2.micronutrient_inventory[Micronutrient.R] == 4.0
+
+    def test_deep_copied_garden_keeps_state_when_plants_are_added(self):
+        self.garden.add_plant(self.rhodo_variety, Position(5, 5))
+        self.garden.add_plant(self.geranium_variety, Position(7, 5))
+
+        assert len(self.garden.plants) == 2
+
+        garden = copy.deepcopy(self.garden)
+        Engine(garden).run_turn()
+        inventories = [plant.micronutrient_inventory.copy() for plant in garden.plants]
+        sizes = [plant.size for plant in garden.plants]
+        assert all(size > 0 for size in sizes)
+
+        garden.add_plant(self.begonia_variety, Position(12, 5))
+
+        assert [plant.micronutrient_inventory.copy() for plant in garden.plants[:2]] == inventories
+        assert [plant.size for plant in garden.plants[:2]] == sizes
+        assert garden.total_growth() == sum(sizes)
+        assert self.garden.total_growth() == 0.0
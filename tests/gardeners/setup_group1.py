@@ -0,0 +1,34 @@
+import numpy as np
+
+from core.garden import Garden
+from core.micronutrients import Micronutrient
+from core.plants.plant_variety import PlantVariety
+from core.plants.species import Species
+
+
+class TestGroup1Gardener:
+    def setup_method(self, method):
+        # NOTE: Twelve varieties of radius 1-3 from a fixed seed, four of each species
+        rng = np.random.default_rng(11)
+        self.varieties = []
+        for i in range(12):
+            species = list(Species)[i % 3]
+            produced = list(Micronutrient)[i % 3]
+            coefficients = {
+                nutrient: round(float(rng.uniform(1.0, 3.0)), 1)
+                if nutrient == produced
+                else -round(float(rng.uniform(0.2, 1.5)), 1)
+                for nutrient in Micronutrient
+            }
+            self.varieties.append(
+                PlantVariety(
+                    name=f'{species.name.title()} {i}',
+                    radius=int(rng.integers(1, 4)),
+                    species=species,
+                    nutrient_coefficients=coefficients,
+                )
+            )
+
+    @staticmethod
+    def placements(garden: Garden) -> list[tuple[str, float, float]]:
+        return [(plant.variety.name, plant.position.x, plant.position.y) for plant in garden.plants]
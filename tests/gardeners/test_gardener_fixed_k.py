@@ -0,0 +1,68 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from core.engine import Engine
+from core.garden import Garden
+from gardeners.group1 import gardener_fixed_k
+from gardeners.group1.gardener_fixed_k import Gardener1f
+from tests.gardeners.setup_group1 import TestGroup1Gardener
+
+
+class CountingExecutor(ProcessPoolExecutor):
+    submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        CountingExecutor.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class TestGardener1f(TestGroup1Gardener):
+    # NOTE: Expected values were recorded from the gardener before its grouping and placement
+    # were vectorized, they pin the rewrite to the original choices
+
+    def test_groups_match_baseline(self):
+        best_k, groups = Gardener1f(Garden(), self.varieties)._find_best_k_groups_dp()
+
+        assert best_k == 3
+        assert [[variety.name for variety in group] for group in groups] == [
+            ['Rhododendron 0', 'Geranium 1', 'Begonia 2'],
+            ['Rhododendron 3', 'Geranium 4', 'Begonia 5'],
+            ['Rhododendron 6', 'Geranium 7', 'Begonia 8'],
+            ['Rhododendron 9', 'Geranium 10', 'Begonia 11'],
+        ]
+
+    def test_placements_and_growth_match_baseline(self):
+        garden = Garden()
+        Gardener1f(garden, self.varieties).cultivate_garden()
+
+        assert self.placements(garden) == [
+            ('Rhododendron 0', 0.0, 0.0),
+            ('Begonia 2', 3.0, 0.0),
+            ('Geranium 1', 1.5, 2.598076211353316),
+            ('Rhododendron 3', 4.0, 3.4641016151377544),
+            ('Geranium 4', 6.0, 0.0),
+            ('Begonia 5', 6.5, 2.598076211353316),
+            ('Rhododendron 6', 9.0, 0.0),
+            ('Begonia 8', 0.5, 6.0621778264910695),
+            ('Geranium 7', 9.0, 3.4641016151377544),
+            ('Begonia 11', 12.0, 0.0),
+            ('Geranium 10', 11.0, 3.4641016151377544),
+            ('Rhododendron 9', 13.5, 2.598076211353316),
+        ]
+        assert Engine(garden).run_simulation(100)[-1] == 150.0
+
+    def test_pooled_grid_trials_match_serial_trials(self, monkeypatch):
+        serial_garden = Garden()
+        Gardener1f(serial_garden, self.varieties).cultivate_garden()
+
+        monkeypatch.setattr(gardener_fixed_k, 'PARALLEL_TRIAL_MIN_VARIETIES', 0)
+        monkeypatch.setattr(gardener_fixed_k, 'ProcessPoolExecutor', CountingExecutor)
+        monkeypatch.setattr(CountingExecutor, 'submitted', 0)
+        pooled_garden = Garden()
+        Gardener1f(pooled_garden, self.varieties).cultivate_garden()
+
+        assert CountingExecutor.submitted == 2
+        assert self.placements(pooled_garden) == self.placements(serial_garden)
+        assert (
+            Engine(pooled_garden).run_simulation(100)[-1]
+            == Engine(serial_garden).run_simulation(100)[-1]
+        )
@@ -0,0 +1,51 @@
+from core.engine import Engine
+from core.garden import Garden
+from gardeners.group1.gardener_prev import Gardener1Prev
+from tests.gardeners.setup_group1 import TestGroup1Gardener
+
+
+class TestGardener1Prev(TestGroup1Gardener):
+    # NOTE: Expected values were recorded from the gardener before its grouping and placement
+    # were vectorized, they pin the rewrite to the original choices
+
+    def test_groups_match_baseline(self):
+        gardener = Gardener1Prev(Garden(), self.varieties)
+
+        groups = {
+            k: [
+                [variety.name for variety in group] for group in gardener._find_optimal_groups_dp(k)
+            ]
+            for k in (3, 4)
+        }
+
+        assert groups[3] == [
+            ['Geranium 1', 'Rhododendron 3', 'Begonia 5'],
+            ['Begonia 2', 'Geranium 4', 'Rhododendron 6'],
+            ['Rhododendron 9', 'Geranium 10', 'Begonia 11'],
+            ['Rhododendron 0', 'Geranium 7', 'Begonia 8'],
+        ]
+        assert groups[4] == [
+            ['Geranium 1', 'Rhododendron 3', 'Geranium 4', 'Begonia 5'],
+            ['Rhododendron 0', 'Begonia 2', 'Geranium 10', 'Begonia 11'],
+            ['Rhododendron 6', 'Geranium 7', 'Begonia 8', 'Rhododendron 9'],
+        ]
+
+    def test_placements_and_growth_match_baseline(self):
+        garden = Garden()
+        Gardener1Prev(garden, self.varieties).cultivate_garden()
+
+        assert self.placements(garden) == [
+            ('Begonia 5', 0.0, 0.0),
+            ('Rhododendron 3', 2.0, 3.4641016151377544),
+            ('Geranium 1', 2.5, 0.8660254037844386),
+            ('Begonia 2', 6.0, 0.0),
+            ('Rhododendron 6', 7.5, 2.598076211353316),
+            ('Geranium 4', 4.5, 2.598076211353316),
+            ('Begonia 11', 9.0, 0.0),
+            ('Geranium 10', 10.5, 2.598076211353316),
+            ('Rhododendron 9', 12.5, 0.8660254037844386),
+            ('Begonia 8', 16.0, 0.0),
+            ('Rhododendron 0', 4.5, 6.0621778264910695),
+            ('Geranium 7', 1.5, 6.0621778264910695),
+        ]
+        assert Engine(garden).run_simulation(100)[-1] == 116.0
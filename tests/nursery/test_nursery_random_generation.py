@@ -1,3 +1,5 @@
+import random
+
 from core.micronutrients import Micronutrient
 from core.nursery import Nursery
 from core.plants.species import Species
@@ -53,3 +55,12 @@ class TestNurseryRandomGeneration:
 
         assert len(retrieved) == 5
         assert retrieved == generated
+
+    def test_random_seed_makes_generation_reproducible(self):
+        random.seed(7)
+        first = Nursery().generate_random_varieties(count=50)
+
+        random.seed(7)
+        second = Nursery().generate_random_varieties(count=50)
+
+        assert first == second